@@ -4,15 +4,16 @@
 
 import asyncio
 from collections import defaultdict
-from collections.abc import Iterable, Mapping
+from collections.abc import Callable, Iterable, Mapping
 from functools import partial
 import logging
+import time
 from typing import Any
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 
-from .const import I2C_ADDR_RANGES, SIGNAL_STATE_UPDATED
+from .const import DS2413_POLL_INTERVAL, DS2438_RETRY_INTERVAL, I2C_ADDR_RANGES, SIGNAL_STATE_UPDATED
 from .services.i2cClasses.dm117 import DM117, DeviceType
 from .services.i2cClasses.led_controller import LEDConfig
 from .services.i2cClasses.oneWireBus import OneWireBus
@@ -38,11 +39,18 @@ def __init__(self, hass: HomeAssistant, bus: SMBus) -> None:
         self.lock = asyncio.Lock()
         self._pcf_states: dict[int, list[int]] = {}
         self._dm117_states: dict[int, dict[int, int]] = {}
+        self._ds2413_states: dict[str, tuple[bool, bool]] = {}
+        self._ds2413_tracked: dict[str, int] = {}
+        self._ds2413_next_poll = 0.0
+        self._ds2438_tracked: dict[str, int] = {}
+        self._ds2438_retry_at: dict[str, float] = {}
         self._poll_interval = 0.002
         self._stop_event: asyncio.Event | None = None
         self._poll_task: asyncio.Task | None = None
         self._init_done = asyncio.Event()
         self._init_task: asyncio.Task | None = None
+        self._led_refreshes: set[str] = set()
+        self._pcf_pending: dict[int, tuple[dict[int, int], asyncio.Future[bool]]] = {}
 
     def start_initialization(self, dm_config: Mapping[int, Mapping[int, DeviceType]] | None = None) -> None:
         """Kick off asynchronous initialization for initial scans and polling."""
@@ -99,6 +107,38 @@ def dm117_states(self) -> dict[int, dict[int, int]]:
 
         return self._dm117_states
 
+    @property
+    def ds2413_states(self) -> dict[str, tuple[bool, bool]]:
+        """Return cached DS2413 channel states indexed by device ID."""
+
+        return self._ds2413_states
+
+    def track_ds2413(self, device_id: str) -> Callable[[], None]:
+        """Include a DS2413 in the shared poller until the returned callback is called."""
+
+        self._ds2413_tracked[device_id] = self._ds2413_tracked.get(device_id, 0) + 1
+
+        def _untrack() -> None:
+            self._ds2413_tracked[device_id] -= 1
+            if not self._ds2413_tracked[device_id]:
+                del self._ds2413_tracked[device_id]
+                self._ds2413_states.pop(device_id, None)
+
+        return _untrack
+
+    def track_ds2438(self, device_id: str) -> Callable[[], None]:
+        """Let the shared poller drive conversions of a DS2438 until the returned callback is called."""
+
+        self._ds2438_tracked[device_id] = self._ds2438_tracked.get(device_id, 0) + 1
+
+        def _untrack() -> None:
+            self._ds2438_tracked[device_id] -= 1
+            if not self._ds2438_tracked[device_id]:
+                del self._ds2438_tracked[device_id]
+                self._ds2438_retry_at.pop(device_id, None)
+
+        return _untrack
+
     async def scan_devices(
         self,
         *,
@@ -114,19 +154,14 @@ async def scan_devices(
         target_codes = set(device_codes) if device_codes else None
 
         _LOGGER.info("Scanning for I2C devices")
-        found_by_code: dict[str, set[int]] = defaultdict(set)
-
-        for start, end, _, code in I2C_ADDR_RANGES:
-            if target_codes and code not in target_codes:
-                continue
-
-            for addr in range(start, end + 1):
-                try:
-                    await self.hass.async_add_executor_job(self.bus.write_quick, addr)
-                except (SMBusProxyError, OSError):
-                    continue
 
-                found_by_code[code].add(addr)
+        # Probe all addresses in one executor job on the shared bus, serialized with the poller
+        try:
+            async with self.lock:
+                found_by_code = await self.hass.async_add_executor_job(self._probe_i2c_addresses, target_codes)
+        except SMBusProxyError as err:
+            _LOGGER.error("Aborting I2C scan: %s", err)
+            return
 
         log_snapshot = {key: sorted(value) for key, value in found_by_code.items()}
         self.found_i2c_devices = log_snapshot
@@ -138,6 +173,26 @@ async def scan_devices(
 
         await self.scan_onewire()
 
+    def _probe_i2c_addresses(self, target_codes: set[str] | None) -> dict[str, set[int]]:
+        """Return the responding addresses per device code, aborting once the bridge is unreachable."""
+
+        found_by_code: dict[str, set[int]] = defaultdict(set)
+        for start, end, _, code in I2C_ADDR_RANGES:
+            if target_codes and code not in target_codes:
+                continue
+
+            for addr in range(start, end + 1):
+                try:
+                    self.bus.write_quick(addr)
+                except (SMBusProxyError, OSError) as err:
+                    # A missing device keeps the connection, a failed or dropped one does not
+                    if not self.bus.connected:
+                        raise SMBusProxyError(f"SMBus bridge not reachable: {err}") from err
+                    continue
+
+                found_by_code[code].add(addr)
+        return found_by_code
+
     async def start_polling(self) -> None:
         """Start background polling of I2C devices."""
 
@@ -181,6 +236,8 @@ async def _poll_once(self) -> None:
         dm_states: dict[int, dict[int, int]] = {}
 
         async with self.lock:
+            # Read modules one after another: every frame shares the single proxy
+            # connection, so concurrent jobs would only queue on its I/O lock
             for addr, device in self.im117_om117.items():
                 set_high = 0x38 <= addr <= 0x3F
                 try:
@@ -204,10 +261,82 @@ async def _poll_once(self) -> None:
                     elif addr in self._dm117_states:
                         dm_states[addr] = self._dm117_states[addr]
 
+        if self._ds2413_tracked and (now := time.monotonic()) >= self._ds2413_next_poll:
+            self._ds2413_next_poll = now + DS2413_POLL_INTERVAL
+            async with self.lock:
+                self._ds2413_states = await self.hass.async_add_executor_job(
+                    self._read_ds2413_states, list(self._ds2413_tracked)
+                )
+
+        # Only hop to the executor for DS2438 devices with a conversion due or running,
+        # devices that failed a step are left alone until their retry time
+        now = time.monotonic()
+        if ds2438_due := [
+            device_id
+            for device_id in self._ds2438_tracked
+            if self._ds2438_retry_at.get(device_id, 0.0) <= now
+            and (bus := self._get_onewire_bus(device_id))
+            and bus.ds2438.get_cached_reading(device_id) is None
+        ]:
+            async with self.lock:
+                failed = await self.hass.async_add_executor_job(self._tick_ds2438, ds2438_due)
+            for device_id in failed:
+                self._ds2438_retry_at[device_id] = now + DS2438_RETRY_INTERVAL
+
         self._pcf_states = pcf_states
         self._dm117_states = dm_states
         async_dispatcher_send(self.hass, SIGNAL_STATE_UPDATED)
 
+    async def async_write_pcf8574_ports(self, address: int, states: Mapping[int, int]) -> bool:
+        """Write PCF8574 output ports.
+
+        Writes to the same module that are issued while the bus is busy, e.g. by a
+        scene switching several outputs, are merged into a single bus write.
+        """
+
+        device = self.im117_om117.get(address)
+        if device is None:
+            return False
+
+        if (batch := self._pcf_pending.get(address)) is None:
+            batch = self._pcf_pending[address] = ({}, self.hass.loop.create_future())
+            self.hass.async_create_task(
+                self._async_flush_pcf8574_writes(address, device, batch), f"casait_pcf8574_write_{address:02x}"
+            )
+
+        batch[0].update(states)
+        return await asyncio.shield(batch[1])
+
+    async def _async_flush_pcf8574_writes(
+        self, address: int, device: PCF8574, batch: tuple[dict[int, int], asyncio.Future[bool]]
+    ) -> None:
+        try:
+            # Let writes issued in the same event loop iteration join the batch
+            await asyncio.sleep(0)
+
+            async with self.lock:
+                # Only take the batch this task was started for
+                if self._pcf_pending.get(address) is not batch:
+                    return
+                del self._pcf_pending[address]
+                states, result = batch
+                try:
+                    success = await self.hass.async_add_executor_job(device.write_ports, states)
+                except Exception as err:  # noqa: BLE001
+                    result.set_exception(err)
+                else:
+                    result.set_result(success)
+                finally:
+                    if not result.done():
+                        result.cancel()
+        except asyncio.CancelledError:
+            # Cancelled before the batch was taken, release its waiters. Once taken, a
+            # newer batch may be pending for the address and belongs to its own task.
+            if self._pcf_pending.get(address) is batch:
+                del self._pcf_pending[address]
+                batch[1].cancel()
+            raise
+
     async def async_force_refresh(self) -> None:
         """Force a single poll and dispatch."""
 
@@ -273,7 +402,12 @@ async def scan_onewire(self) -> None:
                 continue
 
             for device_id, meta in devices.items():
-                discovered[device_id] = {"bus_address": addr, **meta}
+                discovered[device_id] = {
+                    "bus_address": addr,
+                    "family_code": meta.family_code,
+                    "device_type": meta.device_type,
+                    "rom": list(meta.rom),
+                }
 
         self.ow_devices = discovered
         self.ow_ids = set(discovered)
@@ -324,13 +458,22 @@ async def read_ds2438(self, device_id: str):
         if not bus:
             return None
 
-        if self.lock:
-            async with self.lock:
-                return await self.hass.async_add_executor_job(
-                    bus.ds2438.get_reading, device_id, bus.get_interval(device_id)
-                )
+        # Conversions are driven by the shared poller, readers only consume the published reading
+        return bus.ds2438.get_reading(device_id)
 
-        return await self.hass.async_add_executor_job(bus.ds2438.get_reading, device_id, bus.get_interval(device_id))
+    def _tick_ds2438(self, device_ids: Iterable[str]) -> list[str]:
+        """Advance the conversion of every given DS2438 by one step and return the ones that failed."""
+
+        failed: list[str] = []
+        for device_id in device_ids:
+            if bus := self._get_onewire_bus(device_id):
+                try:
+                    if not bus.ds2438.tick(device_id, bus.get_interval(device_id)):
+                        failed.append(device_id)
+                except Exception:
+                    _LOGGER.exception("Error converting DS2438 %s", device_id)
+                    failed.append(device_id)
+        return failed
 
     async def read_ds2413_state(self, device_id: str, channel: int, *, invert: bool = True) -> bool | None:
         """Read a binary state from a DS2413 channel."""
@@ -347,6 +490,16 @@ async def read_ds2413_state(self, device_id: str, channel: int, *, invert: bool
 
         return await self.hass.async_add_executor_job(read_job)
 
+    def _read_ds2413_states(self, device_ids: Iterable[str]) -> dict[str, tuple[bool, bool]]:
+        """Read both channels of every given DS2413, leaving out devices that fail."""
+
+        states: dict[str, tuple[bool, bool]] = {}
+        for device_id in device_ids:
+            bus = self._get_onewire_bus(device_id)
+            if bus and (channels := bus.read_binary_states(device_id)) is not None:
+                states[device_id] = channels
+        return states
+
     async def write_ds2413_state(self, device_id: str, channel: int, value: bool) -> bool:
         """Write a binary state to a DS2413 channel."""
 
@@ -355,7 +508,14 @@ async def write_ds2413_state(self, device_id: str, channel: int, value: bool) ->
             return False
 
         async with self.lock:
-            return await self.hass.async_add_executor_job(bus.ds2413.set_state, device_id, channel, value)
+            if not await self.hass.async_add_executor_job(bus.ds2413.set_state, device_id, channel, value):
+                return False
+            if device_id in self._ds2413_tracked:
+                # Publish the written state now instead of on the next DS2413 poll
+                self._ds2413_states.update(
+                    await self.hass.async_add_executor_job(self._read_ds2413_states, (device_id,))
+                )
+            return True
 
     async def read_led_config(self, device_id: str, *, use_cache: bool = True) -> LEDConfig | None:
         """Read the LED controller configuration for a device."""
@@ -364,6 +524,15 @@ async def read_led_config(self, device_id: str, *, use_cache: bool = True) -> LE
         if not bus:
             return None
 
+        if use_cache:
+            if (config := bus.led_controller.get_cached_config(device_id)) is not None:
+                return config
+
+            # Serve a recently expired config and refresh it in the background
+            if (config := bus.led_controller.get_stale_config(device_id)) is not None:
+                self._schedule_led_refresh(device_id)
+                return config
+
         read_job = partial(bus.read_led_config, device_id, use_cache)
 
         if self.lock:
@@ -372,6 +541,23 @@ async def read_led_config(self, device_id: str, *, use_cache: bool = True) -> LE
 
         return await self.hass.async_add_executor_job(read_job)
 
+    def _schedule_led_refresh(self, device_id: str) -> None:
+        """Refresh an LED controller configuration without blocking the caller."""
+
+        if device_id in self._led_refreshes:
+            return
+
+        self._led_refreshes.add(device_id)
+        self.hass.async_create_background_task(
+            self._async_refresh_led_config(device_id), f"casait_led_refresh_{device_id}"
+        )
+
+    async def _async_refresh_led_config(self, device_id: str) -> None:
+        try:
+            await self.read_led_config(device_id, use_cache=False)
+        finally:
+            self._led_refreshes.discard(device_id)
+
     async def write_led_config(self, device_id: str, config: LEDConfig) -> bool:
         """Write an LED controller configuration for a device."""
 
@@ -40,6 +40,12 @@
 # Dispatcher signals
 SIGNAL_STATE_UPDATED: Final = "casait_state_updated"
 
+# Seconds between DS2413 reads in the shared poller; a fresh reading takes two passes
+DS2413_POLL_INTERVAL: Final = 0.5
+
+# Seconds before the shared poller retries a DS2438 whose conversion step failed
+DS2438_RETRY_INTERVAL: Final = 15.0
+
 PCF8574_MAPPED_PORTS: Final = {
     0: 2,
     1: 1,
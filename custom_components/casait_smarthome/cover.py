@@ -274,13 +274,14 @@ async def _async_set_outputs(self, up: bool, down: bool) -> None:
         if up and down:
             raise HomeAssistantError("Cannot drive blind up and down simultaneously")
 
-        device = self._api.im117_om117.get(self._address)
-        if not device:
+        if self._address not in self._api.im117_om117:
             raise HomeAssistantError("Output module not available")
 
-        async with self._api.lock:
-            await self.hass.async_add_executor_job(device.write_port, self._hardware_up_port, 0 if up else 1)
-            await self.hass.async_add_executor_job(device.write_port, self._hardware_down_port, 0 if down else 1)
+        # Both direction outputs change in the same port write
+        await self._api.async_write_pcf8574_ports(
+            self._address,
+            {self._hardware_up_port: 0 if up else 1, self._hardware_down_port: 0 if down else 1},
+        )
 
         await self._api.async_force_refresh()
 
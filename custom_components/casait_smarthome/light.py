@@ -23,7 +23,7 @@
     get_dm117_port_configuration,
 )
 from .services.i2cClasses.dm117 import DeviceType, DimmerConfig, DM117PortConfig
-from .services.i2cClasses.led_controller import AnimationMode, Color, LEDConfig
+from .services.i2cClasses.led_controller import COLOR_COUNT, AnimationMode, LEDConfig
 
 ANIMATION_EFFECTS = {
     AnimationMode.STATIC: "Static",
@@ -220,8 +220,7 @@ def rgb_color(self) -> tuple[int, int, int] | None:
 
         if not self._config or not self._config.colors:
             return None
-        first = self._config.colors[0]
-        return (first.red, first.green, first.blue)
+        return self._config.get_color(0)
 
     @property
     def effect(self) -> str | None:
@@ -234,7 +233,8 @@ def effect(self) -> str | None:
     async def async_update(self) -> None:
         """Poll the LED controller configuration."""
 
-        config = await self._api.read_led_config(self._device_id, use_cache=False)
+        # Cached configs are refreshed in the background once they expire, writes update the cache
+        config = await self._api.read_led_config(self._device_id)
         if config is None:
             self._attr_available = False
             return
@@ -276,7 +276,6 @@ async def async_turn_off(self, **kwargs: Any) -> None:
     def _build_target_config(self) -> LEDConfig:
         base = self._config or LEDConfig.create_default()
         colors = base.colors or LEDConfig.create_default().colors
-        colors = [Color(color.red, color.green, color.blue) for color in colors]
 
         return LEDConfig(
             led_count=base.led_count or self._led_count or DEFAULT_LED_COUNT,
@@ -288,23 +287,16 @@ def _build_target_config(self) -> LEDConfig:
         )
 
     def _set_primary_color(self, config: LEDConfig, red: int, green: int, blue: int) -> None:
-        colors = config.colors or []
         red = max(0, min(255, int(red)))
         green = max(0, min(255, int(green)))
         blue = max(0, min(255, int(blue)))
 
-        if colors:
-            colors[0] = Color(red, green, blue)
-        else:
-            colors = [Color(red, green, blue)]
-
-        self._ensure_colors(config, colors)
+        self._ensure_colors(config)
+        config.set_color(0, red, green, blue)
 
-    def _ensure_colors(self, config: LEDConfig, colors: list[Color] | None = None) -> None:
-        palette = list(colors or config.colors or [])
-        while len(palette) < 5:
-            palette.append(Color(0, 0, 0))
-        config.colors = palette[:5]
+    def _ensure_colors(self, config: LEDConfig) -> None:
+        size = COLOR_COUNT * 3
+        config.colors = config.colors[:size].ljust(size, b"\x00")
 
     def _apply_config(self, config: LEDConfig, *, from_read: bool) -> None:
         self._ensure_colors(config)
@@ -317,8 +309,7 @@ def _apply_config(self, config: LEDConfig, *, from_read: bool) -> None:
         self._attr_color_mode = ColorMode.RGB
         self._attr_effect = ANIMATION_EFFECTS.get(config.animation)
         if config.colors:
-            first = config.colors[0]
-            self._attr_rgb_color = (first.red, first.green, first.blue)
+            self._attr_rgb_color = config.get_color(0)
 
     async def _async_write_config(self, config: LEDConfig) -> None:
         self._ensure_colors(config)
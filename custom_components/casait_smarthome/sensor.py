@@ -122,6 +122,11 @@ def __init__(
         super().__init__(device_id, meta, description)
         self._api = api
 
+    async def async_added_to_hass(self) -> None:
+        """Register with the shared poller when entity is added to hass."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._api.track_ds2438(self._device_id))
+
     async def async_update(self) -> None:
         """Fetch the latest reading and update the sensor state."""
         self._attr_available = False
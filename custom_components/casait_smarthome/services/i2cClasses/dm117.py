@@ -35,6 +35,14 @@ def _missing_(cls, value: object) -> DimmerSpeed:
         return cls.DEFAULT
 
 
+# Port type codes sent in the CMD_CONFIG payload
+_PORT_TYPE_CODES: dict[DeviceType, int] = {
+    DeviceType.INPUT: 0,
+    DeviceType.DIMMER: 1,
+    DeviceType.OUTPUT: 2,
+}
+
+
 class DM117:
     """DM117 I2C module implementation supporting Input, Output and Dimmer ports."""
 
@@ -84,33 +92,33 @@ def configure_ports(self, config: dict[int, DeviceType], commit: bool = True) ->
             return False
 
         try:
-            # Prepare configuration data
-            data = bytearray([self.CMD_CONFIG, len(config)])
+            # Prepare configuration data: [CMD][COUNT][TYPE...][CRC8]
+            size = len(config)
+            data = bytearray(size + 3)
+            data[0] = self.CMD_CONFIG
+            data[1] = size
 
             # Add port configurations
-            for device_type in (config[index] for index in sorted(config)):
-                if device_type == DeviceType.INPUT:
-                    data.append(0)
-                elif device_type == DeviceType.OUTPUT:
-                    data.append(2)
-                elif device_type == DeviceType.DIMMER:
-                    data.append(1)
-                else:
-                    _LOGGER.error("Invalid port type: %s", device_type)
+            for offset, index in enumerate(sorted(config), start=2):
+                port_type = _PORT_TYPE_CODES.get(config[index])
+                if port_type is None:
+                    _LOGGER.error("Invalid port type: %s", config[index])
                     return False
+                data[offset] = port_type
 
             # Add CRC8
-            data.append(Crc8Smbus.calc(data))
+            data[-1] = Crc8Smbus.calc(data[:-1])
 
-            # Send configuration
-            self.bus.write_i2c_block_data(self.address, data[0], data[1:])
+            # Send configuration, no load is switched so the bus needs no settling time
+            self.bus.write_i2c_block_data(self.address, data[0], data[1:], settle=0)
 
-            _LOGGER.debug(
-                "Configured DM117 at address %02X with %s ports %s",
-                self.address,
-                len(config),
-                " ".join(f"{value:02X}" for value in data),
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Configured DM117 at address %02X with %s ports %s",
+                    self.address,
+                    len(config),
+                    " ".join(f"{value:02X}" for value in data),
+                )
 
             # Store configuration
             self.port_config = dict(config)
@@ -126,9 +134,8 @@ def configure_ports(self, config: dict[int, DeviceType], commit: bool = True) ->
     def commit_config(self) -> bool:
         """Commit the current configuration to the device."""
         try:
-            data = bytearray([self.CMD_COMMIT])
-            data.append(Crc8Smbus.calc(data))
-            self.bus.write_i2c_block_data(self.address, data[0], data[1:])
+            data = bytes((self.CMD_COMMIT, Crc8Smbus.calc((self.CMD_COMMIT,))))
+            self.bus.write_i2c_block_data(self.address, data[0], data[1:], settle=0)
             _LOGGER.debug("Committed DM117 configuration at address %02X", self.address)
         except OSError:
             _LOGGER.exception("Error committing DM117 configuration")
@@ -161,29 +168,27 @@ def write_port(self, config: DM117PortConfig) -> bool:
                 config.digital.init_value = self.last_values.get(port, value)
                 value = config.digital.raw_value
 
-            data = bytearray(
-                [
-                    self.CMD_WRITE,
-                    port,
-                    (value >> 8) & 0xFF,  # High byte
-                    value & 0xFF,  # Low byte
-                    speed,
-                ]
-            )
-            data.append(Crc8Smbus.calc(data))
+            data = bytearray(6)
+            data[0] = self.CMD_WRITE
+            data[1] = port
+            data[2] = (value >> 8) & 0xFF  # High byte
+            data[3] = value & 0xFF  # Low byte
+            data[4] = speed
+            data[5] = Crc8Smbus.calc(data[:5])
 
             self.bus.write_i2c_block_data(self.address, data[0], data[1:])
 
             self.last_values[port] = value
 
-            _LOGGER.debug(
-                "Writing %s to port %s with speed %s on DM117 at address %02X with %s",
-                value,
-                port,
-                speed,
-                self.address,
-                " ".join(f"{byte:02X}" for byte in data),
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Writing %s to port %s with speed %s on DM117 at address %02X with %s",
+                    value,
+                    port,
+                    speed,
+                    self.address,
+                    " ".join(f"{byte:02X}" for byte in data),
+                )
         except OSError:
             _LOGGER.exception("Error writing to DM117")
             return False
@@ -242,11 +247,12 @@ def read_ports(self) -> dict[int, int] | None:
             # Verify CRC
             calculated_crc = Crc8Smbus.calc(data)
             if received_crc != calculated_crc:
-                _LOGGER.debug(
-                    "Reading from DM117 at address %02X with %s",
-                    self.address,
-                    " ".join(f"{byte:02X}" for byte in [*data, received_crc]),
-                )
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug(
+                        "Reading from DM117 at address %02X with %s",
+                        self.address,
+                        " ".join(f"{byte:02X}" for byte in [*data, received_crc]),
+                    )
                 _LOGGER.error("CRC validation failed")
                 return None
 
@@ -165,14 +165,11 @@ def _read_temperature(self, device_id: str) -> float | None:
             return None
 
         self.bus.bridge.wire_write_byte(self.CMD_READ_SCRATCHPAD)
-        scratchpad = []
-        for _ in range(9):
-            byte = self.bus.bridge.wire_read_byte()
-            if byte is None:
-                return None
-            scratchpad.append(byte)
-
-        if not self.bus.verify_crc8(bytes(scratchpad[:-1]), scratchpad[-1]):
+        scratchpad = self.bus.bridge.wire_read_bytes(9)
+        if scratchpad is None:
+            return None
+
+        if not self.bus.verify_crc8(scratchpad):
             _LOGGER.error("CRC check failed for %s", device_id)
             return None
 
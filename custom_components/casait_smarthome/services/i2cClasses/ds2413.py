@@ -105,20 +105,22 @@ def _get_state(self, device_id: str) -> SensorState:
 
     def get_state(self, device_id: str, channel: int = 0, custom_cache: int | None = None) -> bool | None:
         """Get binary state for specified channel."""
-        state = self._get_state(device_id)
+        states = self.get_states(device_id, custom_cache)
+        if states is None:
+            return None
+        return states[0] if channel == 0 else states[1]
 
-        if state.reading and state.reading.is_valid and state.state != ConversionState.IDLE:
-            return state.reading.port_a if channel == 0 else state.reading.port_b
+    def get_states(self, device_id: str, custom_cache: int | None = None) -> tuple[bool, bool] | None:
+        """Get binary states of both channels."""
+        state = self._get_state(device_id)
 
-        if not self._process_state(device_id, state, custom_cache):
-            if not state.reading:
-                return None
-            return state.reading.port_a if channel == 0 else state.reading.port_b
+        if not (state.reading and state.reading.is_valid and state.state != ConversionState.IDLE):
+            self._process_state(device_id, state, custom_cache)
 
         if not state.reading:
             return None
 
-        return state.reading.port_a if channel == 0 else state.reading.port_b
+        return state.reading.port_a, state.reading.port_b
 
     def _process_state(self, device_id: str, state: SensorState, custom_cache: int | None = None) -> bool:
         try:
@@ -15,8 +15,10 @@
 
 This implementation provides:
 - Non-blocking state machine for all measurements
-- 60-second result caching to reduce bus traffic
-- Automatic multi-parameter reading in single cycle
+- 60-second result caching to reduce bus traffic, extended up to 4x
+  per channel while the measured values stay stable
+- Automatic multi-parameter reading in single cycle, limited to the
+  channels whose cached values have expired
 - Comprehensive error handling and validation
 - Debug logging for all operations
 
@@ -24,8 +26,9 @@
 - Datasheet: https://www.analog.com/media/en/technical-documentation/data-sheets/DS2438.pdf
 """
 
+from collections.abc import Callable
 from dataclasses import dataclass
-from enum import Enum, auto
+from enum import Enum, IntFlag, auto
 import logging
 import time
 
@@ -35,22 +38,52 @@
 CACHE_TIMEOUT = 60
 CONVERSION_TIME = 0.050  # 50ms conversion time
 
+# Adaptive cache: a channel's TTL doubles (up to MAX_TTL_FACTOR x base) while
+# consecutive readings stay within tolerance and resets to base on change
+MAX_TTL_FACTOR = 4
+VOLTAGE_TOLERANCE = 0.01  # 10mV A/D resolution
+VSE_TOLERANCE = 0.0005  # ~2 LSB of the 0.2441mV current sense A/D
+TEMP_TOLERANCE = 0.25  # °C
+
+
+def _next_ttl(ttl: float, previous: float | None, value: float | None, tolerance: float, base: float) -> float:
+    """Return the adapted TTL for a channel after a new reading."""
+    if previous is None or value is None or abs(value - previous) >= tolerance:
+        return base
+    return min(max(ttl, base) * 2, base * MAX_TTL_FACTOR)
+
 
 class ConversionState(Enum):
     """States for conversion state machine."""
 
     IDLE = auto()
-    VDD_CONFIG = auto()
     VDD_CONVERT = auto()
     VDD_READ = auto()
-    VAD_CONFIG = auto()
     VAD_CONVERT = auto()
     VAD_READ = auto()
     TEMP_CONVERT = auto()
     TEMP_READ = auto()
 
 
-@dataclass
+class ConversionPhase(IntFlag):
+    """Measurement phases of a conversion cycle, usable as a bitmask."""
+
+    VDD = 1
+    VAD = 2  # VAD and VSE are read from the same scratchpad
+    TEMP = 4
+
+
+ALL_PHASES = ConversionPhase.VDD | ConversionPhase.VAD | ConversionPhase.TEMP
+
+# Phases in execution order with the state each one starts in
+PHASE_START_STATES: tuple[tuple[ConversionPhase, ConversionState], ...] = (
+    (ConversionPhase.VDD, ConversionState.VDD_CONVERT),
+    (ConversionPhase.VAD, ConversionState.VAD_CONVERT),
+    (ConversionPhase.TEMP, ConversionState.TEMP_CONVERT),
+)
+
+
+@dataclass(frozen=True, slots=True)
 class DS2438Reading:
     """Container for DS2438 sensor readings."""
 
@@ -58,23 +91,17 @@ class DS2438Reading:
     vad: float  # A/D voltage input
     vse: float  # Current sense voltage
     temperature: float  # Temperature in Celsius
-    timestamp: float  # When reading was taken
-    cache_timeout: int = CACHE_TIMEOUT
+    timestamp: float  # When reading was taken (time.monotonic())
 
-    @property
-    def age(self) -> float:
-        """Get age of reading in seconds."""
-        return time.time() - self.timestamp
 
-    @property
-    def is_valid(self) -> bool:
-        """Check if reading is still valid."""
-        return self.age < self.cache_timeout
-
-
-@dataclass
+@dataclass(slots=True)
 class DS2438State:
-    """State tracking for DS2438 device."""
+    """State tracking for DS2438 device.
+
+    ``reading`` is the published reading handed to callers. The state
+    machine stages new values in the ``new_*`` fields and replaces
+    ``reading`` as a whole once a cycle completes.
+    """
 
     state: ConversionState = ConversionState.IDLE
     last_action: float = 0
@@ -83,24 +110,85 @@ class DS2438State:
     new_vad: float | None = None
     new_vse: float | None = None
     new_temp: float | None = None
-
-    def start_conversion(self):
-        """Start new conversion cycle."""
-        self.state = ConversionState.VDD_CONFIG
-        self.last_action = time.time()
-        self.new_vdd = None
-        self.new_vad = None
-        self.new_vse = None
-        self.new_temp = None
-
-    @property
-    def conversion_ready(self) -> bool:
+    ttl_vdd: float = CACHE_TIMEOUT
+    ttl_vad: float = CACHE_TIMEOUT
+    ttl_vse: float = CACHE_TIMEOUT
+    ttl_temp: float = CACHE_TIMEOUT
+    expired_mask: int = 0  # ConversionPhase bits refreshed by the current cycle
+    pending_mask: int = 0  # ConversionPhase bits still to be measured in this cycle
+    refreshed_vdd: float = 0
+    refreshed_vad: float = 0
+    refreshed_temp: float = 0
+
+    def expired_phases(self, now: float) -> int:
+        """Return the ConversionPhase bits whose values have expired."""
+        if self.reading is None:
+            return ALL_PHASES
+
+        mask = 0
+        if now - self.refreshed_vdd >= self.ttl_vdd:
+            mask |= ConversionPhase.VDD
+        if now - self.refreshed_vad >= min(self.ttl_vad, self.ttl_vse):
+            mask |= ConversionPhase.VAD
+        if now - self.refreshed_temp >= self.ttl_temp:
+            mask |= ConversionPhase.TEMP
+        return mask
+
+    def next_state(self, completed: int = 0) -> ConversionState:
+        """Mark ``completed`` phases as measured and return the next start state."""
+        self.expired_mask |= completed
+        self.pending_mask &= ~completed
+        for phase, start_state in PHASE_START_STATES:
+            if self.pending_mask & phase:
+                return start_state
+        return ConversionState.IDLE
+
+    def start_conversion(self, now: float, expired_mask: int):
+        """Start new conversion cycle for the expired phases.
+
+        Values of phases that are still fresh are carried over from the
+        current reading.
+        """
+        self.expired_mask = expired_mask
+        self.pending_mask = expired_mask
+        self.state = self.next_state()
+        self.last_action = now
+        previous = self.reading
+        self.new_vdd = None if previous is None or expired_mask & ConversionPhase.VDD else previous.vdd
+        self.new_temp = None if previous is None or expired_mask & ConversionPhase.TEMP else previous.temperature
+        if previous is None or expired_mask & ConversionPhase.VAD:
+            self.new_vad = None
+            self.new_vse = None
+        else:
+            self.new_vad = previous.vad
+            self.new_vse = previous.vse
+
+    def conversion_ready(self, now: float) -> bool:
         """Check if enough time has passed since last action."""
-        return time.time() - self.last_action >= CONVERSION_TIME
+        return now - self.last_action >= CONVERSION_TIME
 
-    def update_timestamp(self):
+    def update_timestamp(self, now: float):
         """Update last action timestamp."""
-        self.last_action = time.time()
+        self.last_action = now
+
+    def complete_cycle(self, base: float, now: float):
+        """Adapt TTLs and refresh times of the measured phases."""
+        previous = self.reading
+        mask = self.expired_mask
+        if mask & ConversionPhase.VDD:
+            self.ttl_vdd = _next_ttl(self.ttl_vdd, previous and previous.vdd, self.new_vdd, VOLTAGE_TOLERANCE, base)
+            self.refreshed_vdd = now
+        if mask & ConversionPhase.VAD:
+            self.ttl_vad = _next_ttl(self.ttl_vad, previous and previous.vad, self.new_vad, VOLTAGE_TOLERANCE, base)
+            self.ttl_vse = _next_ttl(self.ttl_vse, previous and previous.vse, self.new_vse, VSE_TOLERANCE, base)
+            self.refreshed_vad = now
+        if mask & ConversionPhase.TEMP:
+            self.ttl_temp = _next_ttl(
+                self.ttl_temp, previous and previous.temperature, self.new_temp, TEMP_TOLERANCE, base
+            )
+            self.refreshed_temp = now
+        self.expired_mask = 0
+        self.pending_mask = 0
 
 
 class DS2438:
@@ -131,6 +219,15 @@ def __init__(self, bus_interface) -> None:
         """
         self.bus = bus_interface
         self._device_states: dict[str, DS2438State] = {}  # State tracking by device ID
+        # State handlers return the next state on success or None on failure
+        self._handlers: dict[ConversionState, Callable[[str, DS2438State], ConversionState | None]] = {
+            ConversionState.VDD_CONVERT: self._handle_vdd_convert,
+            ConversionState.VDD_READ: self._handle_vdd_read,
+            ConversionState.VAD_CONVERT: self._handle_vad_convert,
+            ConversionState.VAD_READ: self._handle_vad_read,
+            ConversionState.TEMP_CONVERT: self._handle_temp_convert,
+            ConversionState.TEMP_READ: self._handle_temp_read,
+        }
 
     def _get_state(self, device_id: str) -> DS2438State:
         """Get or create state tracker for device."""
@@ -138,42 +235,60 @@ def _get_state(self, device_id: str) -> DS2438State:
             self._device_states[device_id] = DS2438State()
         return self._device_states[device_id]
 
-    def get_reading(self, device_id: str, custom_cache: int | None = None) -> DS2438Reading | None:
-        """Get reading, starting new conversion cycle if needed.
+    def get_reading(self, device_id: str) -> DS2438Reading | None:
+        """Get the last published reading.
+
+        Conversions are driven by ``tick``, this never touches the bus.
+
+        Args:
+            device_id: ROM ID of DS2438 device
+
+        Returns:
+            DS2438Reading if a cycle has completed (might be expired), None otherwise
+        """
+        state = self._device_states.get(device_id)
+        return None if state is None else state.reading
+
+    def tick(self, device_id: str, custom_cache: int | None = None) -> bool:
+        """Advance the conversion state machine of a device by one step.
+
+        Measured values are staged in the ``new_*`` fields and only published
+        to ``DS2438State.reading`` once the cycle completes, with a single
+        attribute assignment. Readers therefore always see a complete reading.
 
         Args:
             device_id: ROM ID of DS2438 device
-            custom_cache: Override default cache timeout
+            custom_cache: Override default (minimum) cache timeout
 
         Returns:
-            DS2438Reading if available (might be cached), None on error
+            bool: True if the step succeeded or no work was due, False on error
         """
         state = self._get_state(device_id)
+        now = time.monotonic()
 
-        # Return existing reading if still valid and not in IDLE state
-        if state.reading and state.reading.is_valid and state.state != ConversionState.IDLE:
-            return state.reading
+        # Only start a new cycle if at least one channel has expired
+        if state.state == ConversionState.IDLE and not state.expired_phases(now):
+            return True
 
         # Process current state
-        if not self._process_state(device_id, state):
-            return state.reading  # Return last known reading on error
+        if not self._process_state(device_id, state, now):
+            return False
 
-        # If we completed a full cycle, create new reading
+        # If we completed a full cycle, publish the new reading
         if (
             state.state == ConversionState.IDLE
-            and self._all_values_present(state)
             and state.new_vdd is not None
             and state.new_vad is not None
             and state.new_vse is not None
             and state.new_temp is not None
         ):
+            state.complete_cycle(custom_cache or CACHE_TIMEOUT, now)
             state.reading = DS2438Reading(
                 vdd=state.new_vdd,
                 vad=state.new_vad,
                 vse=state.new_vse,
                 temperature=state.new_temp,
-                timestamp=time.time(),
-                cache_timeout=custom_cache or CACHE_TIMEOUT,
+                timestamp=now,
             )
             _LOGGER.debug(
                 "Completed conversion for %s: VDD=%.3fV VAD=%.3fV VSE=%.3fV Temp=%.1f°C",
@@ -184,9 +299,24 @@ def get_reading(self, device_id: str, custom_cache: int | None = None) -> DS2438
                 state.new_temp,
             )
 
+        return True
+
+    def get_cached_reading(self, device_id: str) -> DS2438Reading | None:
+        """Return the current reading if no bus access is needed to refresh it.
+
+        This never touches the bus and is safe to call from the event loop.
+
+        Returns:
+            DS2438Reading if no channel has expired, None otherwise
+        """
+        state = self._device_states.get(device_id)
+        if state is None or state.state != ConversionState.IDLE:
+            return None
+        if state.expired_phases(time.monotonic()):
+            return None
         return state.reading
 
-    def _process_state(self, device_id: str, state: DS2438State) -> bool:
+    def _process_state(self, device_id: str, state: DS2438State, now: float) -> bool:
         """Process current state of conversion.
 
         Returns:
@@ -196,93 +326,22 @@ def _process_state(self, device_id: str, state: DS2438State) -> bool:
             # Start new conversion cycle if IDLE
             if state.state == ConversionState.IDLE:
                 _LOGGER.debug("Starting new conversion cycle for device DS2438 %s", device_id)
-                state.start_conversion()
+                state.start_conversion(now, state.expired_phases(now))
                 return True
 
             # Wait for conversion/action time
-            if not state.conversion_ready:
+            if not state.conversion_ready(now):
                 return True
 
-            # Process each state
-            if state.state == ConversionState.VDD_CONFIG:
-                if self._write_config(device_id, 0x08):  # Enable VDD measurement
-                    state.state = ConversionState.VDD_CONVERT
-                    state.update_timestamp()
-                    _LOGGER.debug("VDD configuration successful for %s", device_id)
-                    return True
-
-            elif state.state == ConversionState.VDD_CONVERT:
-                if self._start_voltage_conversion(device_id) and self._start_temp_conversion(device_id):
-                    state.state = ConversionState.VDD_READ
-                    state.update_timestamp()
-                    _LOGGER.debug("VDD conversion started for %s", device_id)
+            # Dispatch to the handler of the current state
+            handler = self._handlers.get(state.state)
+            if handler is not None:
+                next_state = handler(device_id, state)
+                if next_state is not None:
+                    state.state = next_state
+                    state.update_timestamp(now)
                     return True
 
-            elif state.state == ConversionState.VDD_READ:
-                vdd = self._read_voltage(device_id)
-                if vdd is not None:
-                    state.new_vdd = vdd
-                    state.state = ConversionState.VAD_CONFIG
-                    state.update_timestamp()
-                    _LOGGER.debug(
-                        "VDD read successful for %s: VDD=%.3fV",
-                        device_id,
-                        state.new_vdd,
-                    )
-                    return True
-
-            elif state.state == ConversionState.VAD_CONFIG:
-                if self._write_config(device_id, 0x00):  # Enable VAD measurement
-                    state.state = ConversionState.VAD_CONVERT
-                    state.update_timestamp()
-                    _LOGGER.debug("VAD configuration successful for %s", device_id)
-                    return True
-
-            elif state.state == ConversionState.VAD_CONVERT:
-                if self._start_voltage_conversion(device_id):
-                    state.state = ConversionState.VAD_READ
-                    state.update_timestamp()
-                    _LOGGER.debug("VAD conversion started for %s", device_id)
-                    return True
-
-            elif state.state == ConversionState.VAD_READ:
-                scratchpad = self._read_scratchpad(device_id, recall_memory=True)
-                if scratchpad:
-                    # Read both VAD and VSE from same scratchpad
-                    state.new_vad = (scratchpad[4] << 8 | scratchpad[3]) / 100.0  # VAD
-                    state.new_vse = (scratchpad[6] << 8 | scratchpad[5]) * 0.2441 / 1000.0  # VSE
-                    state.state = ConversionState.TEMP_CONVERT
-                    state.update_timestamp()
-                    _LOGGER.debug(
-                        "VAD/VSE read successful for %s: VAD=%.3fV VSE=%.3fV",
-                        device_id,
-                        state.new_vad,
-                        state.new_vse,
-                    )
-                    return True
-
-            elif state.state == ConversionState.TEMP_CONVERT:
-                if self._start_temp_conversion(device_id):
-                    state.state = ConversionState.TEMP_READ
-                    state.update_timestamp()
-                    _LOGGER.debug("Temperature conversion started for %s", device_id)
-                    return True
-
-            elif state.state == ConversionState.TEMP_READ:
-                scratchpad = self._read_scratchpad(device_id)
-                if scratchpad:
-                    temp = (scratchpad[2] << 8 | scratchpad[1]) / 256.0
-                    if temp <= 85:  # Valid reading
-                        state.new_temp = temp
-                        state.state = ConversionState.IDLE
-                        state.update_timestamp()
-                        _LOGGER.debug(
-                            "Temperature read successful for %s: %.1f°C",
-                            device_id,
-                            temp,
-                        )
-                        return True
-
             _LOGGER.error("Failed to process state %s for device %s", state.state, device_id)
             state.state = ConversionState.IDLE  # Reset on error
 
@@ -292,34 +351,103 @@ def _process_state(self, device_id: str, state: DS2438State) -> bool:
             return False
         return False
 
-    def _all_values_present(self, state: DS2438State) -> bool:
-        """Check if all new values are present."""
-        return all(x is not None for x in [state.new_vdd, state.new_vad, state.new_vse, state.new_temp])
+    def _handle_vdd_convert(self, device_id: str, state: DS2438State) -> ConversionState | None:
+        # The configuration write takes effect immediately, so the conversions
+        # can be started in the same step. Each function command still needs
+        # its own reset and MATCH ROM.
+        if not (
+            self._write_config(device_id, 0x08)  # Enable VDD measurement
+            and self._start_voltage_conversion(device_id)
+            and self._start_temp_conversion(device_id)
+        ):
+            return None
+        _LOGGER.debug("VDD conversion started for %s", device_id)
+        return ConversionState.VDD_READ
+
+    def _handle_vdd_read(self, device_id: str, state: DS2438State) -> ConversionState | None:
+        scratchpad = self._read_scratchpad(device_id, recall_memory=True)
+        if not scratchpad:
+            return None
 
-    def _write_config(self, device_id: str, config: int) -> bool:
-        """Write configuration byte."""
+        # Status byte controls whether we read VDD or VAD
+        # Bit 3 enables VDD measurement
+        if not (scratchpad[0] & 0x08):
+            _LOGGER.error("VDD measurement not enabled")
+            return None
+
+        state.new_vdd = ((scratchpad[4] << 8) | scratchpad[3]) / 100.0
+        _LOGGER.debug("VDD read successful for %s: VDD=%.3fV", device_id, state.new_vdd)
+
+        # The temperature conversion ran alongside the VDD conversion, so the
+        # same scratchpad already holds a fresh temperature
+        completed = ConversionPhase.VDD
+        temp = self._parse_temperature(scratchpad)
+        if temp is not None:
+            state.new_temp = temp
+            completed |= ConversionPhase.TEMP
+            _LOGGER.debug("Temperature read successful for %s: %.1f°C", device_id, temp)
+        return state.next_state(completed)
+
+    def _handle_vad_convert(self, device_id: str, state: DS2438State) -> ConversionState | None:
+        if not (
+            self._write_config(device_id, 0x00)  # Enable VAD measurement
+            and self._start_voltage_conversion(device_id)
+        ):
+            return None
+        _LOGGER.debug("VAD conversion started for %s", device_id)
+        return ConversionState.VAD_READ
+
+    def _handle_vad_read(self, device_id: str, state: DS2438State) -> ConversionState | None:
+        scratchpad = self._read_scratchpad(device_id, recall_memory=True)
+        if not scratchpad:
+            return None
+        # Read both VAD and VSE from same scratchpad
+        state.new_vad = (scratchpad[4] << 8 | scratchpad[3]) / 100.0  # VAD
+        state.new_vse = (scratchpad[6] << 8 | scratchpad[5]) * 0.2441 / 1000.0  # VSE
+        _LOGGER.debug(
+            "VAD/VSE read successful for %s: VAD=%.3fV VSE=%.3fV",
+            device_id,
+            state.new_vad,
+            state.new_vse,
+        )
+        return state.next_state(ConversionPhase.VAD)
+
+    def _handle_temp_convert(self, device_id: str, state: DS2438State) -> ConversionState | None:
+        if not self._start_temp_conversion(device_id):
+            return None
+        _LOGGER.debug("Temperature conversion started for %s", device_id)
+        return ConversionState.TEMP_READ
+
+    def _handle_temp_read(self, device_id: str, state: DS2438State) -> ConversionState | None:
+        scratchpad = self._read_scratchpad(device_id)
+        if not scratchpad:
+            return None
+        temp = self._parse_temperature(scratchpad)
+        if temp is None:
+            return None
+        state.new_temp = temp
+        _LOGGER.debug("Temperature read successful for %s: %.1f°C", device_id, temp)
+        return state.next_state(ConversionPhase.TEMP)
+
+    def _with_device(self, device_id: str, *commands: int) -> bool:
+        """Select the device once and write a function command sequence."""
         if not self.bus.select_device(device_id):
             return False
 
-        self.bus.bridge.wire_write_byte(self.CMD_WRITE_SCRATCHPAD)
-        self.bus.bridge.wire_write_byte(0x00)  # Page 0
-        self.bus.bridge.wire_write_byte(config)
+        write_byte = self.bus.bridge.wire_write_byte
+        return all(write_byte(command) for command in commands)
 
-        return True
+    def _write_config(self, device_id: str, config: int) -> bool:
+        """Write configuration byte."""
+        return self._with_device(device_id, self.CMD_WRITE_SCRATCHPAD, 0x00, config)  # Page 0
 
     def _start_voltage_conversion(self, device_id: str) -> bool:
         """Start voltage conversion."""
-        if not self.bus.select_device(device_id):
-            return False
-
-        return self.bus.bridge.wire_write_byte(self.CMD_CONVERT_VOLTAGE)
+        return self._with_device(device_id, self.CMD_CONVERT_VOLTAGE)
 
     def _start_temp_conversion(self, device_id: str) -> bool:
         """Start temperature conversion."""
-        if not self.bus.select_device(device_id):
-            return False
-
-        return self.bus.bridge.wire_write_byte(self.CMD_CONVERT_TEMP)
+        return self._with_device(device_id, self.CMD_CONVERT_TEMP)
 
     def _read_scratchpad(self, device_id: str, recall_memory: bool = False) -> bytes | None:
         """Read 9 bytes of scratchpad memory."""
@@ -328,46 +456,31 @@ def _read_scratchpad(self, device_id: str, recall_memory: bool = False) -> bytes
                 _LOGGER.error("Failed to recall memory for device %s", device_id)
                 return None
 
-        if not self.bus.select_device(device_id):
+        if not self._with_device(device_id, self.CMD_READ_SCRATCHPAD, 0x00):  # Page 0
             return None
 
-        self.bus.bridge.wire_write_byte(self.CMD_READ_SCRATCHPAD)
-        self.bus.bridge.wire_write_byte(0x00)  # Page 0
-
-        scratchpad = []
-        for _ in range(9):
-            byte = self.bus.bridge.wire_read_byte()
-            if byte is None:
-                return None
-            scratchpad.append(byte)
+        scratchpad = self.bus.bridge.wire_read_bytes(9)
+        if scratchpad is None:
+            return None
 
-        _LOGGER.debug("%s scratchpad: %s", device_id, " ".join(f"{x:02X}" for x in scratchpad))
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("%s scratchpad: %s", device_id, " ".join(f"{x:02X}" for x in scratchpad))
 
         # Verify CRC
-        if not self.bus.verify_crc8(bytes(scratchpad[:-1]), scratchpad[-1]):
+        if not self.bus.verify_crc8(scratchpad):
             _LOGGER.error("CRC check failed for device %s", device_id)
             return None
 
-        return bytes(scratchpad)
-
-    def _read_voltage(self, device_id: str) -> float | None:
-        """Read voltage from scratchpad."""
-        scratchpad = self._read_scratchpad(device_id, recall_memory=True)
-        if not scratchpad:
-            return None
+        return scratchpad
 
-        # Status byte controls whether we read VDD or VAD
-        # Bit 3 enables VDD measurement
-        status = scratchpad[0]
-        if not (status & 0x08):
-            _LOGGER.error("VDD measurement not enabled")
+    @staticmethod
+    def _parse_temperature(scratchpad: bytes) -> float | None:
+        """Extract temperature from scratchpad page 0, None if out of range."""
+        temp = (scratchpad[2] << 8 | scratchpad[1]) / 256.0
+        if temp > 85:  # Invalid reading
             return None
-
-        return ((scratchpad[4] << 8) | scratchpad[3]) / 100.0
+        return temp
 
     def _recall_memory(self, device_id: str) -> bool:
         """Recall memory from EEPROM."""
-        if not self.bus.select_device(device_id):
-            return False
-
-        return self.bus.bridge.wire_write_byte(self.CMD_RECALL_MEMORY) and self.bus.bridge.wire_write_byte(0x00)
+        return self._with_device(device_id, self.CMD_RECALL_MEMORY, 0x00)
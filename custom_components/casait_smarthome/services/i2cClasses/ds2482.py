@@ -35,6 +35,13 @@ class DS2482:
     REG_DATA = 0xE1
     REG_CONFIG = 0xC3
 
+    # Nominal 1-Wire operation times in microseconds (standard speed)
+    DELAY_RESET_US = 1100
+    DELAY_BYTE_US = 560
+    DELAY_BIT_US = 80
+    DELAY_TRIPLET_US = 3 * DELAY_BIT_US  # Two read slots and one write slot
+    POLL_WINDOW = 0.0002  # Poll without sleeping for 200us after the delay
+
     def __init__(self, bus, address: int) -> None:
         """Initialize DS2482 device."""
         self.bus = bus
@@ -69,17 +76,29 @@ def reset(self) -> bool:
             _LOGGER.error(traceback.format_exc())
             return False
 
-    def _wait_busy(self, timeout: float = 0.1, retries: int = 3) -> bool:
-        """Wait until the 1-Wire bus is not busy."""
+    def _wait_busy(self, min_delay_us: int = 0, timeout: float = 0.1, retries: int = 3) -> bool:
+        """Wait until the 1-Wire bus is not busy.
+
+        Args:
+            min_delay_us: Minimum duration of the pending 1-Wire operation. The
+                status register is only polled once this time has passed.
+            timeout: Maximum time to poll per attempt in seconds
+            retries: Number of attempts on I2C errors
+        """
+        if min_delay_us:
+            time.sleep(min_delay_us / 1_000_000)
+
         for attempt in range(retries):
             try:
-                start_time = time.time()
-                while time.time() - start_time < timeout:
+                start_time = time.monotonic()
+                while (elapsed := time.monotonic() - start_time) < timeout:
                     status = self.bus.read_byte(self.address)
                     if not (status & self.STATUS_1WB):
                         self._last_status = status
                         return True
-                    time.sleep(0.001)
+                    # Poll back-to-back for a short window, then back off
+                    if elapsed >= self.POLL_WINDOW:
+                        time.sleep(0.0001)
             except OSError as e:
                 _LOGGER.warning("Retry %s/%s: %s", attempt + 1, retries, e)
                 continue
@@ -89,7 +108,7 @@ def wire_reset(self) -> bool:
         """Reset the 1-Wire bus and check for presence pulse."""
         try:
             self.bus.write_byte(self.address, self.CMD_1WIRE_RESET)
-            if not self._wait_busy():
+            if not self._wait_busy(self.DELAY_RESET_US):
                 _LOGGER.error("Timeout waiting for 1-Wire reset")
                 return False
 
@@ -107,40 +126,92 @@ def wire_reset(self) -> bool:
 
     def wire_write_byte(self, byte: int) -> bool:
         """Write a byte to the 1-Wire bus."""
+        return self.wire_write_bytes(bytes((byte,)))
+
+    def wire_write_bytes(self, data: bytes | bytearray) -> bool:
+        """Write a sequence of bytes to the 1-Wire bus in one call.
+
+        The DS2482 has no burst write: each byte is its own 1-Wire Write Byte
+        command, and the chip ignores new commands while 1-Wire Busy is set.
+        The bytes are written back to back with only the busy wait between them.
+        """
         try:
-            self.bus.write_byte_data(self.address, self.CMD_1WIRE_WRITE_BYTE, byte)
-            return self._wait_busy()
+            for byte in data:
+                self.bus.write_byte_data(self.address, self.CMD_1WIRE_WRITE_BYTE, byte)
+                if not self._wait_busy(self.DELAY_BYTE_US):
+                    return False
         except OSError as e:
             _LOGGER.error("1-Wire write error: %s", e)
             _LOGGER.error(traceback.format_exc())
             return False
+        return True
 
     def wire_read_byte(self) -> int | None:
         """Read a byte from the 1-Wire bus."""
+        data = self.wire_read_bytes(1)
+        return None if data is None else data[0]
+
+    def wire_read_bytes(self, count: int) -> bytes | None:
+        """Read ``count`` bytes from the 1-Wire bus in one call.
+
+        The DS2482 resets its read pointer to the status register after every
+        1-Wire command, so the data register pointer has to be set again for
+        each byte. Collecting the bytes here keeps the loop and error handling
+        out of the callers.
+        """
+        data = bytearray(count)
         try:
-            # Send read command
-            self.bus.write_byte(self.address, self.CMD_1WIRE_READ_BYTE)
-            if not self._wait_busy():
-                return None
-
-            # Set pointer to data register
-            self.bus.write_byte_data(self.address, self.CMD_SET_READ_PTR, self.REG_DATA)
-
-            # Read data
-            return self.bus.read_byte(self.address)
+            for index in range(count):
+                # Send read command
+                self.bus.write_byte(self.address, self.CMD_1WIRE_READ_BYTE)
+                if not self._wait_busy(self.DELAY_BYTE_US):
+                    return None
+
+                # Set pointer to data register. This cannot be folded into a
+                # read_byte_data() call: Set Read Pointer needs its register code
+                # as a second byte, and every 1-Wire command moves the pointer
+                # back to the status register, so it is never already in place.
+                self.bus.write_byte_data(self.address, self.CMD_SET_READ_PTR, self.REG_DATA)
+                data[index] = self.bus.read_byte(self.address)
         except OSError as e:
             _LOGGER.error("1-Wire read error: %s", e)
             _LOGGER.error(traceback.format_exc())
             return None
+        return bytes(data)
 
     def wire_single_bit(self, bit: bool) -> bool | None:
         """Write and read a single bit on the 1-Wire bus."""
         try:
             self.bus.write_byte_data(self.address, self.CMD_1WIRE_SINGLE_BIT, 0x80 if bit else 0x00)
-            if not self._wait_busy():
+            if not self._wait_busy(self.DELAY_BIT_US):
                 return None
             return bool(self._last_status & self.STATUS_SBR)
         except OSError as e:
             _LOGGER.error("1-Wire single bit error: %s", e)
             _LOGGER.error(traceback.format_exc())
             return None
+
+    def wire_triplet(self, direction: bool) -> tuple[bool, bool, bool] | None:
+        """Run a 1-Wire triplet for the ROM search algorithm.
+
+        Reads a bit and its complement, then writes the branch direction, all in
+        one command. If the two read bits differ the chip writes the read bit
+        instead of ``direction``.
+
+        Returns:
+            tuple[bool, bool, bool]: (id_bit, cmp_id_bit, taken_direction) or None on error
+        """
+        try:
+            self.bus.write_byte_data(self.address, self.CMD_1WIRE_TRIPLET, 0x80 if direction else 0x00)
+            if not self._wait_busy(self.DELAY_TRIPLET_US):
+                return None
+            status = self._last_status
+            return (
+                bool(status & self.STATUS_SBR),
+                bool(status & self.STATUS_TSB),
+                bool(status & self.STATUS_DIR),
+            )
+        except OSError as e:
+            _LOGGER.error("1-Wire triplet error: %s", e)
+            _LOGGER.error(traceback.format_exc())
+            return None
@@ -17,11 +17,17 @@
 - Datasheet: https://www.analog.com/media/en/technical-documentation/data-sheets/ds28e17.pdf
 """
 
+from collections.abc import Callable
 import logging
 import time
 
 _LOGGER = logging.getLogger(__name__)
 
+I2C_BYTE_TIME_US = 25  # ~9 clock cycles per byte at 400kHz
+POLL_MAX_RETRIES = 100
+POLL_INITIAL_BACKOFF = 0.00005  # 50us
+POLL_MAX_BACKOFF = 0.001  # 1ms
+
 
 class DS28E17:
     """DS28E17 1-Wire to I2C Bridge implementation."""
@@ -40,6 +46,64 @@ def __init__(self, bus_interface) -> None:
             bus_interface: Interface to 1-Wire bus (must support select_device() and other low-level operations)
         """
         self.bus = bus_interface
+        # Read packets only depend on address and length, so their CRC is computed once
+        self._read_packets: dict[tuple[int, int], bytes] = {}
+
+    def _write_busy(self) -> bool | None:
+        """Poll the busy byte sent while a write transaction is running."""
+        value = self.bus.bridge.wire_read_byte()
+        return None if value is None else value != 0
+
+    def _read_busy(self) -> bool | None:
+        """Poll the busy bit sent while a read transaction is running."""
+        return self.bus.bridge.wire_single_bit(True)
+
+    def _wait_transaction(self, poll: Callable[[], bool | None], num_bytes: int) -> bool:
+        """Wait until the DS28E17 has finished the I2C transaction.
+
+        Sleeps for the nominal transfer time of the transaction first, then
+        polls with an exponentially growing delay capped at 1ms.
+
+        Args:
+            poll: Returns True while busy, False when done, None on bus error
+            num_bytes: Number of I2C payload bytes in the transaction
+
+        Returns:
+            bool: True if the transaction completed
+        """
+        time.sleep((num_bytes + 3) * I2C_BYTE_TIME_US / 1_000_000)
+
+        delay = POLL_INITIAL_BACKOFF
+        for _ in range(POLL_MAX_RETRIES):
+            busy = poll()
+            if busy is None:
+                _LOGGER.error("Error polling I2C transaction status")
+                return False
+            if not busy:
+                return True
+            time.sleep(delay)
+            delay = min(delay * 1.5, POLL_MAX_BACKOFF)
+
+        _LOGGER.error("Timeout waiting for transaction completion")
+        return False
+
+    def _build_packet(self, command: int, i2c_addr: int, length: int, data: bytes = b"") -> bytearray:
+        """Build a command packet with its inverted CRC16 in a single buffer.
+
+        Layout: [CMD][ADDR][LEN][DATA...][CRC_L][CRC_H]
+        """
+        end = len(data) + 3
+        packet = bytearray(end + 2)
+        packet[0] = command
+        packet[1] = i2c_addr
+        packet[2] = length
+        packet[3:end] = data
+
+        # Calculate CRC16 over command + address + length + data
+        crc = ~self.bus.calc_crc16(memoryview(packet)[:end]) & 0xFFFF  # Invert CRC as per Arduino code
+        packet[end] = crc & 0xFF
+        packet[end + 1] = crc >> 8
+        return packet
 
     def write_data(self, device_id: str, address: int, data: bytes) -> bool:
         """Write data to I2C device through bridge.
@@ -64,21 +128,10 @@ def write_data(self, device_id: str, address: int, data: bytes) -> bool:
         # Calculate 7-bit address with write bit (LSB=0)
         i2c_addr = (address << 1) & 0xFF
 
-        # Ensure data length is valid (1-255 bytes)
-        if not 1 <= len(data) <= 255:
-            _LOGGER.error("Invalid data length: %s", len(data))
-            return False
-
-        # Construct command packet:
-        # [CMD][ADDR][LEN][DATA...][CRC_L][CRC_H]
-        packet = bytes([self.CMD_WRITE_DATA, i2c_addr, len(data)]) + data
-
-        # Calculate CRC16 over command + address + length + data
-        crc = self.bus.calc_crc16(packet)
-        crc = ~crc & 0xFFFF  # Invert CRC as per Arduino code
-        packet += bytes([crc & 0xFF, crc >> 8])
+        packet = self._build_packet(self.CMD_WRITE_DATA, i2c_addr, len(data), data)
 
-        _LOGGER.debug("Writing I2C packet: %s", " ".join(f"{x:02X}" for x in packet))
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Writing I2C packet: %s", " ".join(f"{x:02X}" for x in packet))
 
         if not self.bus.bridge.wire_reset():
             _LOGGER.error("Failed to reset bus")
@@ -88,24 +141,12 @@ def write_data(self, device_id: str, address: int, data: bytes) -> bool:
             _LOGGER.error("Failed to select device %s", device_id)
             return False
 
-        for byte in packet:
-            if not self.bus.bridge.wire_write_byte(byte):
-                _LOGGER.error("Failed to write byte %02X", byte)
-                return False
+        if not self.bus.bridge.wire_write_bytes(packet):
+            _LOGGER.error("Failed to write I2C packet")
+            return False
 
-        retries = 0
-        while True:
-            bit = self.bus.bridge.wire_read_byte()
-            if bit is None:
-                _LOGGER.error("Error polling I2C transaction status")
-                return False
-            if bit == 0:
-                break
-            retries += 1
-            if retries >= 100:
-                _LOGGER.error("Timeout waiting for transaction completion")
-                return False
-            time.sleep(0.001)
+        if not self._wait_transaction(self._write_busy, len(data)):
+            return False
 
         status = self.bus.bridge.wire_read_byte()
         write_status = self.bus.bridge.wire_read_byte()
@@ -140,50 +181,30 @@ def read_data(self, device_id: str, address: int, num_bytes: int) -> bytes | Non
         # Calculate 7-bit address with read bit (LSB=1)
         i2c_addr = ((address << 1) | 0x01) & 0xFF
 
-        # Construct command packet:
-        # [CMD][ADDR][LEN][CRC_L][CRC_H]
-        packet = bytes([self.CMD_READ_DATA, i2c_addr, num_bytes])
+        key = (i2c_addr, num_bytes)
+        if (packet := self._read_packets.get(key)) is None:
+            packet = self._read_packets[key] = bytes(self._build_packet(self.CMD_READ_DATA, i2c_addr, num_bytes))
 
-        # Calculate CRC16
-        crc = self.bus.calc_crc16(packet)
-        crc = ~crc & 0xFFFF  # Invert CRC
-        packet += bytes([crc & 0xFF, crc >> 8])
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Reading I2C packet - command: %s", " ".join(f"{x:02X}" for x in packet))
 
-        _LOGGER.debug("Reading I2C packet - command: %s", " ".join(f"{x:02X}" for x in packet))
+        if not self.bus.bridge.wire_reset():
+            _LOGGER.error("Failed to reset bus")
+            return None
 
-        _LOGGER.debug("Selecting device %s", device_id)
         # Select device and write command packet
+        _LOGGER.debug("Selecting device %s", device_id)
         if not self.bus.select_device(device_id):
             _LOGGER.error("Failed to select device %s", device_id)
             return None
 
-        if not self.bus.bridge.wire_reset():
-            _LOGGER.error("Failed to reset bus")
+        if not self.bus.bridge.wire_write_bytes(packet):
+            _LOGGER.error("Failed to write command packet")
             return None
 
-        if not self.bus.select_device(device_id):
-            _LOGGER.error("Failed to select device %s", device_id)
+        if not self._wait_transaction(self._read_busy, num_bytes):
             return None
 
-        for byte in packet:
-            if not self.bus.bridge.wire_write_byte(byte):
-                _LOGGER.error("Failed to write command byte %02X", byte)
-                return None
-
-        retries = 0
-        while True:
-            bit = self.bus.bridge.wire_single_bit(True)
-            if bit is None:
-                _LOGGER.error("Error reading status bit")
-                return None
-            if not bit:
-                break
-            retries += 1
-            if retries >= 100:
-                _LOGGER.error("Timeout waiting for transaction completion")
-                return None
-            time.sleep(0.001)
-
         status = self.bus.bridge.wire_read_byte()
         if status is None:
             _LOGGER.error("Failed to read status byte")
@@ -191,13 +212,11 @@ def read_data(self, device_id: str, address: int, num_bytes: int) -> bytes | Non
 
         _LOGGER.debug("Status byte: %02X", status)
 
-        data = bytearray()
-        for _ in range(num_bytes):
-            byte = self.bus.bridge.wire_read_byte()
-            if byte is None:
-                _LOGGER.error("Failed to read data byte %s", len(data))
-                return None
-            data.append(byte)
+        data = self.bus.bridge.wire_read_bytes(num_bytes)
+        if data is None:
+            _LOGGER.error("Failed to read %s data bytes", num_bytes)
+            return None
 
-        _LOGGER.debug("Read complete - data: %s", " ".join(f"{x:02X}" for x in data))
-        return bytes(data)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Read complete - data: %s", " ".join(f"{x:02X}" for x in data))
+        return data
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 import enum
 import logging
+import random
+import struct
 import time
 
 from .ds28e17 import DS28E17
@@ -12,6 +14,8 @@
 _LOGGER = logging.getLogger(__name__)
 
 CACHE_TIMEOUT = 20  # Cache timeout in seconds
+WRITE_RETRY_DELAY = 0.005  # Initial delay between write retries in seconds
+COLOR_COUNT = 5  # Number of RGB colors in the configuration
 
 
 class AnimationMode(enum.Enum):
@@ -24,24 +28,6 @@ class AnimationMode(enum.Enum):
     ALTERNATE = 4
 
 
-@dataclass
-class Color:
-    """RGB color representation."""
-
-    red: int
-    green: int
-    blue: int
-
-    def to_bytes(self) -> bytes:
-        """Convert color to bytes for transmission."""
-        return bytes([self.red, self.green, self.blue])
-
-    @classmethod
-    def from_bytes(cls, data: bytes) -> Color:
-        """Create Color instance from bytes."""
-        return cls(red=data[0], green=data[1], blue=data[2])
-
-
 @dataclass
 class LEDConfig:
     """Configuration payload for the LED controller."""
@@ -51,7 +37,17 @@ class LEDConfig:
     brightness: int = 0  # 1-31 in hardware, 0-255 in validation
     animation: AnimationMode = AnimationMode.STATIC
     animation_speed: int = 0  # 0-255
-    colors: list[Color] = field(default_factory=list)
+    colors: bytes = b""  # COLOR_COUNT packed RGB triplets
+
+    def get_color(self, index: int) -> tuple[int, int, int]:
+        """Return the RGB values of the color at ``index``."""
+        offset = index * 3
+        return self.colors[offset], self.colors[offset + 1], self.colors[offset + 2]
+
+    def set_color(self, index: int, red: int, green: int, blue: int) -> None:
+        """Replace the color at ``index``."""
+        offset = index * 3
+        self.colors = self.colors[:offset] + bytes((red, green, blue)) + self.colors[offset + 3 :]
 
     @classmethod
     def create_default(cls) -> LEDConfig:
@@ -62,13 +58,7 @@ def create_default(cls) -> LEDConfig:
             brightness=128,
             animation=AnimationMode.STATIC,
             animation_speed=50,
-            colors=[
-                Color(255, 255, 255),  # White
-                Color(0, 0, 0),
-                Color(0, 0, 0),
-                Color(0, 0, 0),
-                Color(0, 0, 0),
-            ],
+            colors=bytes((255, 255, 255)) + bytes((COLOR_COUNT - 1) * 3),  # White, then black
         )
 
     def validate(self) -> bool:
@@ -80,14 +70,7 @@ def validate(self) -> bool:
             return False
         if not 0 <= self.animation_speed <= 255:
             return False
-        if len(self.colors) != 5:
-            return False
-
-        for color in self.colors:
-            if not (0 <= color.red <= 255 and 0 <= color.green <= 255 and 0 <= color.blue <= 255):
-                return False
-
-        return True
+        return len(self.colors) == COLOR_COUNT * 3
 
 
 @dataclass
@@ -95,17 +78,26 @@ class CachedConfig:
     """Cache container for LED configuration."""
 
     config: LEDConfig
-    timestamp: float
-    cache_time: float = CACHE_TIMEOUT
+    timestamp_ns: int  # time.monotonic_ns() when the config was cached
+    cache_time_ns: int = CACHE_TIMEOUT * 1_000_000_000
 
     @property
     def is_valid(self) -> bool:
         """Check if cached config is still valid."""
-        return time.time() - self.timestamp < self.cache_time
+        return time.monotonic_ns() - self.timestamp_ns < self.cache_time_ns
+
+    @property
+    def is_stale(self) -> bool:
+        """Check if cached config expired less than one cache period ago."""
+        return self.cache_time_ns <= time.monotonic_ns() - self.timestamp_ns < 2 * self.cache_time_ns
 
 
 class LEDController:
-    """LED Controller implementation using DS28E17 bridge."""
+    """LED Controller implementation using DS28E17 bridge.
+
+    A successful write stores the written configuration in the cache, a failed
+    write drops the cached entry so the next read fetches it from the device.
+    """
 
     # I2C registers (matching Arduino implementation)
     I2C_ADDRESS = 0x42
@@ -116,6 +108,11 @@ class LEDController:
     REG_ANIM_SPEED = 0x04
     REG_COLORS = 0x05  # Colors start here (3 bytes per color)
 
+    # Write packet: start register, 5 config bytes and the packed RGB colors
+    _PACKET = struct.Struct(f"<6B{COLOR_COUNT * 3}s")
+    # Read response: 5 config bytes and the packed RGB colors, starting at register 0
+    _RESPONSE = struct.Struct(f"<5B{COLOR_COUNT * 3}s")
+
     def __init__(self, bus_interface) -> None:
         """Initialize LED Controller.
 
@@ -129,30 +126,33 @@ def __init__(self, bus_interface) -> None:
 
     def write_config(self, device_id: str, config: LEDConfig, custom_cache: int | None = None) -> bool:
         """Write LED configuration."""
+        # Skip the bus transaction if the controller already has this configuration.
+        # Cached configs were validated before they were stored, so an equal config is valid too.
+        cached = self._config_cache.get(device_id)
+        if cached is not None and cached.is_valid and cached.config == config:
+            _LOGGER.debug("LED configuration for device %s unchanged, skipping write", device_id)
+            return True
+
         if not config.validate():
             _LOGGER.error("Invalid LED configuration")
             return False
 
         try:
-            # Prepare data packet starting with register address
-            data = bytearray(
-                [
-                    self.REG_LED_COUNT,  # Start register
-                    config.led_count,
-                    1 if config.state else 0,
-                    config.brightness,
-                    config.animation.value,
-                    config.animation_speed,
-                ]
+            # Prepare data packet starting with register address, followed by the color data
+            data = self._PACKET.pack(
+                self.REG_LED_COUNT,  # Start register
+                config.led_count,
+                1 if config.state else 0,
+                config.brightness,
+                config.animation.value,
+                config.animation_speed,
+                config.colors,
             )
 
-            # Add color data
-            for color in config.colors:
-                data.extend([color.red, color.green, color.blue])
-
             retries = 4
+            delay = WRITE_RETRY_DELAY
             while retries > 0:
-                if self.bridge.write_data(device_id, self.I2C_ADDRESS, bytes(data)):
+                if self.bridge.write_data(device_id, self.I2C_ADDRESS, data):
                     break
 
                 retries -= 1
@@ -160,23 +160,29 @@ def write_config(self, device_id: str, config: LEDConfig, custom_cache: int | No
                     "Failed to write LED configuration; retries remaining: %s",
                     retries,
                 )
-                time.sleep(0.2)
+                if retries:
+                    # Exponential backoff with jitter so concurrent writers do not retry in lockstep
+                    time.sleep(delay + random.uniform(0, delay / 2))
+                    delay *= 2
 
             if retries == 0:
                 _LOGGER.error("Failed to write LED configuration")
+                # The device state is unknown now, force the next read to hit the device
+                self.invalidate_cache(device_id)
                 return False
 
             # Update cache with new configuration
             self._config_cache[device_id] = CachedConfig(
                 config=config,
-                timestamp=time.time(),
-                cache_time=custom_cache or CACHE_TIMEOUT,
+                timestamp_ns=time.monotonic_ns(),
+                cache_time_ns=int((custom_cache or CACHE_TIMEOUT) * 1_000_000_000),
             )
 
             _LOGGER.info("Successfully wrote LED configuration for device %s", device_id)
 
         except Exception:
             _LOGGER.exception("Error writing LED configuration")
+            self.invalidate_cache(device_id)
             return False
         return True
 
@@ -193,7 +199,7 @@ def read_config(self, device_id: str, custom_cache: int | None = None, use_cache
             # Calculate total bytes to read:
             # - 5 bytes for basic config (count, state, brightness, mode, speed)
             # - 15 bytes for colors (5 colors × 3 bytes each)
-            total_bytes = 20
+            total_bytes = self._RESPONSE.size
 
             # Read data through bridge
             data = self.bridge.read_data(device_id, self.I2C_ADDRESS, total_bytes)
@@ -201,18 +207,9 @@ def read_config(self, device_id: str, custom_cache: int | None = None, use_cache
                 _LOGGER.error("Failed to read configuration data")
                 return None
 
-            # Parse configuration
-            led_count = data[self.REG_LED_COUNT]
-            led_state = bool(data[self.REG_LED_STATE])
-            brightness = data[self.REG_BRIGHTNESS]
-            animation_code = data[self.REG_ANIM_MODE]
-            animation_speed = data[self.REG_ANIM_SPEED]
-
-            # Parse colors (5 colors, 3 bytes each)
-            colors = []
-            for i in range(5):
-                offset = self.REG_COLORS + (i * 3)
-                colors.append(Color(red=data[offset], green=data[offset + 1], blue=data[offset + 2]))
+            # Parse configuration and colors (5 colors, 3 bytes each)
+            led_count, led_state, brightness, animation_code, animation_speed, colors = self._RESPONSE.unpack_from(data)
+            led_state = bool(led_state)
 
             try:
                 animation = AnimationMode(animation_code)
@@ -236,8 +233,8 @@ def read_config(self, device_id: str, custom_cache: int | None = None, use_cache
             # Update cache with new configuration
             self._config_cache[device_id] = CachedConfig(
                 config=config,
-                timestamp=time.time(),
-                cache_time=custom_cache or CACHE_TIMEOUT,
+                timestamp_ns=time.monotonic_ns(),
+                cache_time_ns=int((custom_cache or CACHE_TIMEOUT) * 1_000_000_000),
             )
 
         except Exception:
@@ -253,6 +250,11 @@ def get_cached_config(self, device_id: str) -> LEDConfig | None:
         cached = self._config_cache[device_id]
         return cached.config if cached.is_valid else None
 
+    def get_stale_config(self, device_id: str) -> LEDConfig | None:
+        """Get an expired configuration from cache that may still be served while it is refreshed."""
+        cached = self._config_cache.get(device_id)
+        return cached.config if cached is not None and cached.is_stale else None
+
     def invalidate_cache(self, device_id: str | None = None) -> None:
         """Invalidate cache for specific device or all devices."""
         if device_id is None:
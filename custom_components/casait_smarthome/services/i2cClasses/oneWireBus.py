@@ -5,7 +5,7 @@
 import enum
 import logging
 import time
-from typing import Any
+from typing import Any, NamedTuple
 
 from .ds18b20 import DS18B20
 from .ds2413 import DS2413
@@ -17,6 +17,21 @@
 
 MAX_FAILURES = 3
 TIMEOUT_DURATION = 300  # 5 minutes
+SCAN_FAULT_COOLDOWN = 5.0  # seconds without rescans after a bus fault
+
+
+def _reflected_crc_entry(value: int, polynomial: int) -> int:
+    """Run the bitwise reflected CRC over a single byte value."""
+    crc = value
+    for _ in range(8):
+        crc = (crc >> 1) ^ polynomial if crc & 0x01 else crc >> 1
+    return crc
+
+
+# Lookup tables for the Dallas/Maxim CRC8 (reflected polynomial 0x8C) and
+# the CRC16 with reflected polynomial 0xA001
+_CRC8_TABLE = bytes(_reflected_crc_entry(value, 0x8C) for value in range(256))
+_CRC16_TABLE = tuple(_reflected_crc_entry(value, 0xA001) for value in range(256))
 
 
 class OneWireType(enum.Enum):
@@ -28,12 +43,32 @@ class OneWireType(enum.Enum):
     DS28E17 = "DS28E17"  # 1-wire memory
 
 
+# 1-Wire family codes of the supported devices
+_FAMILY_TYPES: dict[int, str] = {
+    0x19: OneWireType.DS28E17.value,
+    0x28: OneWireType.DS18XB20.value,
+    0x26: OneWireType.DS2438.value,
+    0x3A: OneWireType.DS2413.value,
+}
+
+
+class DeviceEntry(NamedTuple):
+    """A device found during a bus scan."""
+
+    family_code: int
+    device_type: str
+    rom: bytes
+    rom_hex: str
+    match_rom: bytes  # MATCH ROM command followed by the ROM, written by select_device
+
+
 class OneWireBus:
     """1-Wire bus implementation using DS2482-100."""
 
     # ROM commands
     CMD_SEARCH_ROM = 0xF0
     CMD_MATCH_ROM = 0x55
+    _MATCH_ROM_PREFIX = bytes((CMD_MATCH_ROM,))
 
     # DS28E17 Commands
     CMD_WRITE_DATA_STOP = 0x4B  # Write data with stop
@@ -60,7 +95,7 @@ def __init__(self, bus, bridge_address: int) -> None:
             bridge_address,
         )
         self.bridge = DS2482(bus, bridge_address)
-        self.devices: dict[str, dict[str, Any]] = {}
+        self.devices: dict[str, DeviceEntry] = {}
         self.ds2438 = DS2438(self)
         self.ds18b20 = DS18B20(self)
         self.ds2413 = DS2413(self)
@@ -68,9 +103,10 @@ def __init__(self, bus, bridge_address: int) -> None:
         self.last_scan_time = 0
         self._interval_cache: dict[str, int | None] = {}
         self._timeout_cache: dict[str, tuple[float, int]] = {}
+        self._scan_fault_until = 0.0
         self._scan_bus()
 
-    def scan_devices(self, force: bool = False) -> dict:
+    def scan_devices(self, force: bool = False) -> dict[str, DeviceEntry]:
         """Scan 1-Wire bus for devices with optional force refresh."""
         current_time = time.time()
 
@@ -78,68 +114,73 @@ def scan_devices(self, force: bool = False) -> dict:
         if not force and (current_time - self.last_scan_time) < 60:
             return self.devices
 
+        if self._in_scan_cooldown():
+            _LOGGER.debug("Skipping scan of 1-Wire bus %02x after bus fault", self.bridge.address)
+            return self.devices
+
         self._scan_bus()
         self.last_scan_time = current_time
         return self.devices
 
     def _scan_bus(self):
         """Scan 1-Wire bus for devices using proper search algorithm."""
-        if not self.bridge.wire_reset():
+        # Bind the bridge methods used in the search loops once
+        bridge = self.bridge
+        wire_reset = bridge.wire_reset
+        wire_triplet = bridge.wire_triplet
+
+        if not wire_reset():
+            self._set_scan_fault()
             return {}
 
-        _LOGGER.info("Scanning 1-Wire bus %02x for devices", self.bridge.address)
-        devices = {}
+        _LOGGER.info("Scanning 1-Wire bus %02x for devices", bridge.address)
+        devices: dict[str, DeviceEntry] = {}
         rom_no = bytearray(8)  # 64-bit ROM code
         last_discrepancy = 0
         last_device_flag = False
 
         while not last_device_flag:
             # Initialize for search
-            self.bridge.wire_reset()
-            self.bridge.wire_write_byte(self.CMD_SEARCH_ROM)
+            wire_reset()
+            bridge.wire_write_byte(self.CMD_SEARCH_ROM)
 
             last_zero = 0
             id_bit_number = 1
 
             # Search all 64 bits of ROM code
             while id_bit_number <= 64:
-                # Read two bits and get their complement
-                id_bit = self.bridge.wire_single_bit(True)
-                cmp_id_bit = self.bridge.wire_single_bit(True)
+                byte_index = (id_bit_number - 1) // 8
+                bit_mask = 1 << ((id_bit_number - 1) % 8)
+
+                # Direction to take if there is a discrepancy at this bit
+                if id_bit_number == last_discrepancy:
+                    search_direction = True
+                elif id_bit_number > last_discrepancy:
+                    search_direction = False
+                else:
+                    search_direction = bool(rom_no[byte_index] & bit_mask)
 
-                if id_bit is None or cmp_id_bit is None:
+                # Read the bit and its complement and write the direction in one triplet
+                result = wire_triplet(search_direction)
+                if result is None:
+                    self._set_scan_fault()
                     return devices
+                id_bit, cmp_id_bit, search_direction = result
 
                 # Check for no devices on the bus
                 if id_bit and cmp_id_bit:
                     return devices
 
-                # Determine search direction
-                if id_bit != cmp_id_bit:
-                    search_direction = id_bit  # Bits differ, use actual
-                else:
-                    # Bits are both 0 or both 1
-                    if id_bit_number == last_discrepancy:
-                        search_direction = 1
-                    elif id_bit_number > last_discrepancy:
-                        search_direction = 0
-                    else:
-                        search_direction = (rom_no[(id_bit_number - 1) // 8] >> ((id_bit_number - 1) % 8)) & 0x01
-
-                    if search_direction == 0:
-                        last_zero = id_bit_number
+                # Bits are both 0 and the 0 branch was taken
+                if not id_bit and not cmp_id_bit and not search_direction:
+                    last_zero = id_bit_number
 
                 # Set or clear bit in ROM byte
-                byte_index = (id_bit_number - 1) // 8
-                bit_mask = 1 << ((id_bit_number - 1) % 8)
-
                 if search_direction:
                     rom_no[byte_index] |= bit_mask
                 else:
                     rom_no[byte_index] &= ~bit_mask
 
-                # Write the search direction bit
-                self.bridge.wire_single_bit(bool(search_direction))
                 id_bit_number += 1
 
             # Check if valid device found
@@ -147,16 +188,19 @@ def _scan_bus(self):
                 last_device_flag = True
             else:
                 # Valid device found, process ROM code
-                crc8 = self._calc_crc8(bytes(rom_no[:-1]))
-                if crc8 == rom_no[7]:  # CRC check
-                    device_id = "".join(f"{x:02x}" for x in rom_no)
-                    family_code = rom_no[0]
-
-                    devices[device_id] = {
-                        "family_code": family_code,
-                        "device_type": self._get_device_type(family_code),
-                        "rom": list(rom_no),
-                    }
+                # CRC check: running the CRC over the ROM including its CRC byte yields 0
+                if self._calc_crc8(rom_no) == 0:
+                    rom = bytes(rom_no)
+                    device_id = rom.hex()
+                    family_code = rom[0]
+
+                    devices[device_id] = DeviceEntry(
+                        family_code,
+                        self._get_device_type(family_code),
+                        rom,
+                        device_id,
+                        self._MATCH_ROM_PREFIX + rom,
+                    )
 
                 last_discrepancy = last_zero
                 if last_discrepancy == 0:
@@ -166,42 +210,46 @@ def _scan_bus(self):
         _LOGGER.info("1-Wire bus scan found %d devices", len(devices))
         return devices
 
+    def _set_scan_fault(self) -> None:
+        """Suspend rescans for a while so a faulted bus is not hammered by repeated scans."""
+        _LOGGER.warning(
+            "1-Wire bus %02x fault during scan, suspending scans for %ss", self.bridge.address, SCAN_FAULT_COOLDOWN
+        )
+        self._scan_fault_until = time.monotonic() + SCAN_FAULT_COOLDOWN
+
+    def _in_scan_cooldown(self) -> bool:
+        return time.monotonic() < self._scan_fault_until
+
     def _get_device_type(self, family_code: int) -> str:
         """Map family code to device type string."""
-        family_types = {
-            0x19: OneWireType.DS28E17.value,
-            0x28: OneWireType.DS18XB20.value,
-            0x26: OneWireType.DS2438.value,
-            0x3A: OneWireType.DS2413.value,
-        }
-        return family_types.get(family_code, "Unknown")
-
-    def _calc_crc8(self, data: bytes) -> int:
+        return _FAMILY_TYPES.get(family_code, "Unknown")
+
+    @staticmethod
+    def _calc_crc8(data: bytes | bytearray | memoryview) -> int:
         """Calculate CRC8 using polynomial x^8 + x^5 + x^4 + 1."""
+        table = _CRC8_TABLE
         crc = 0
         for byte in data:
-            crc ^= byte
-            for _ in range(8):
-                if crc & 0x01:
-                    crc = (crc >> 1) ^ 0x8C
-                else:
-                    crc >>= 1
+            crc = table[crc ^ byte]
         return crc
 
-    def calc_crc16(self, data: bytes) -> int:
+    @staticmethod
+    def calc_crc16(data: bytes | memoryview) -> int:
         """Calculate CRC16 using polynomial 0xA001 (modbus)."""
+        table = _CRC16_TABLE
         crc = 0
         for byte in data:
-            crc ^= byte
-            for _ in range(8):
-                if crc & 0x01:
-                    crc = (crc >> 1) ^ 0xA001
-                else:
-                    crc >>= 1
+            crc = (crc >> 8) ^ table[(crc ^ byte) & 0xFF]
         return crc
 
-    def verify_crc8(self, data: bytes, crc: int) -> bool:
-        """Verify CRC8 of data."""
+    def verify_crc8(self, data: bytes | memoryview, crc: int | None = None) -> bool:
+        """Verify CRC8 of data.
+
+        Without ``crc`` the last byte of ``data`` is taken as its CRC: running the
+        CRC over data and CRC byte together yields 0, so no slice is needed.
+        """
+        if crc is None:
+            return self._calc_crc8(data) == 0
         return self._calc_crc8(data) == crc
 
     def select_device(self, device_id: str, use_lock: bool = True) -> bool:
@@ -211,6 +259,9 @@ def select_device(self, device_id: str, use_lock: bool = True) -> bool:
         # and return false if the device is in the cache
         # this should prevent _scan_bus from being called multiple times and block the bus for a long noticeable time
         if device_id not in self.devices:
+            if self._in_scan_cooldown():
+                _LOGGER.debug("Device %s not found in cache, bus scan suspended after fault", device_id)
+                return False
             _LOGGER.warning("Device %s not found in cache, rescanning bus", device_id)
             self._scan_bus()
             if device_id not in self.devices:
@@ -232,12 +283,10 @@ def select_device(self, device_id: str, use_lock: bool = True) -> bool:
             self._increment_failures(device_id)
             return False
 
-        self.bridge.wire_write_byte(self.CMD_MATCH_ROM)
-        for byte in self.devices[device_id]["rom"]:
-            if not self.bridge.wire_write_byte(byte):
-                _LOGGER.error("Failed to write ROM byte for device %s", device_id)
-                self._increment_failures(device_id)
-                return False
+        if not self.bridge.wire_write_bytes(self.devices[device_id].match_rom):
+            _LOGGER.error("Failed to write ROM bytes for device %s", device_id)
+            self._increment_failures(device_id)
+            return False
         return True
 
     def _increment_failures(self, device_id: str) -> None:
@@ -269,35 +318,6 @@ def read_temperature(self, device_id: str) -> float | None:
             _LOGGER.exception("Error reading temperature")
             return None
 
-    def read_voltage(self, device_id: str, port: int = 0) -> dict | None:
-        """Read voltage and temperature from DS2438.
-
-        Args:
-            device_id: ROM ID of the DS2438
-            port: Port number (0 for VAD, 1 for VSE)
-
-        Returns:
-            Dictionary containing temperature and voltage readings or None on failure
-        """
-        try:
-            # Get reading from DS2438 manager
-            reading = self.ds2438.get_reading(device_id, self.get_interval(device_id))
-            if not reading:
-                return None
-
-            # Select appropriate voltage based on port
-            voltage = reading.vad if port == 0 else reading.vse
-
-        except Exception:
-            _LOGGER.exception("Error reading DS2438 %s", device_id)
-            return None
-
-        return {
-            "voltage": voltage,
-            "temperature": reading.temperature,
-            "vdd": reading.vdd,
-        }
-
     def read_binary_state(self, device_id: str, channel: int = 0, *, invert: bool = True) -> bool | None:
         """Read binary state from DS2413."""
         try:
@@ -311,6 +331,14 @@ def read_binary_state(self, device_id: str, channel: int = 0, *, invert: bool =
             return not state
         return state
 
+    def read_binary_states(self, device_id: str) -> tuple[bool, bool] | None:
+        """Read the binary states of both DS2413 channels."""
+        try:
+            return self.ds2413.get_states(device_id, self.get_interval(device_id))
+        except Exception:
+            _LOGGER.exception("Error reading binary states")
+            return None
+
     def write_led_config(self, device_id: str, config: LEDConfig) -> bool:
         """Write LED configuration to device.
 
@@ -1,5 +1,6 @@
 """PCF8574 I2C I/O expander implementation for CasaIT Smart Home integration."""
 
+from collections.abc import Mapping
 import logging
 import time
 import traceback
@@ -8,6 +9,9 @@
 
 MIN_INIT = 5
 
+# Port values (bit 0 first) for every possible port register value
+_BIT_LUT = tuple(tuple((value >> bit) & 1 for bit in range(8)) for value in range(256))
+
 
 class PCF8574:
     """PCF8574 I2C I/O expander implementation."""
@@ -34,26 +38,30 @@ def read_ports(self, set_high: bool = True) -> tuple[list[int], int]:
 
             # Read current value
             value = self.bus.read_byte(self.address)
-            curr_time = time.time() * 1000
-
-            port_values = [(value & (1 << i)) >> i for i in range(8)]
-            if self.debounce_time > 0:
-                # Debounce logic
-                if value != self.last_value:
-                    if value != self._new_value:
-                        # First detection of new value
-                        self._new_value = value
-                        self._new_value_time = curr_time
-                        value = self.last_value
-                    # Check if debounce time passed
-                    elif curr_time - self._new_value_time >= self.debounce_time:
-                        # Update port states
-                        self.port_states = port_values
-                        self.last_value = value
-            else:
+            curr_time = time.monotonic_ns() // 1_000_000
+
+            # Debounce on locals and store the result once
+            last_value = self.last_value
+            new_value = self._new_value
+            new_value_time = self._new_value_time
+
+            if self.debounce_time <= 0:
                 # No debounce
-                self.port_states = port_values
-                self.last_value = value
+                last_value = value
+            elif value != last_value:
+                if value != new_value:
+                    # First detection of new value
+                    new_value = value
+                    new_value_time = curr_time
+                    value = last_value
+                # Check if debounce time passed
+                elif curr_time - new_value_time >= self.debounce_time:
+                    last_value = value
+
+            if last_value != self.last_value:
+                # Update port states
+                self.port_states = list(_BIT_LUT[last_value])
+            self.last_value, self._new_value, self._new_value_time = last_value, new_value, new_value_time
 
             if self._init_counter < MIN_INIT:
                 self._init_counter += 1
@@ -65,20 +73,24 @@ def read_ports(self, set_high: bool = True) -> tuple[list[int], int]:
 
     def write_port(self, port: int, state: int, verify: bool = True) -> bool:
         """Write to specific port with optional verification."""
-        if not 0 <= port <= 7:
+        return self.write_ports({port: state}, verify)
+
+    def write_ports(self, states: Mapping[int, int], verify: bool = True) -> bool:
+        """Write several ports in a single bus write with optional verification."""
+        if not all(0 <= port <= 7 for port in states):
             raise ValueError("Port must be 0-7")
 
         try:
             # Ensure we have a valid last_value before doing bit operations.
             # If last_value is invalid (-1 or out of range), read current state first.
+            # A plain read returns the output latch levels, writing 0xFF first would
+            # briefly release every output and needs an extra transaction and settle time.
             if not 0 <= self.last_value <= 255:
                 logger.debug(
                     "PCF8574 0x%02X: last_value invalid (%s), reading current state",
                     self.address,
                     self.last_value,
                 )
-                self.bus.write_byte(self.address, 0xFF)
-                time.sleep(0.002)
                 self.last_value = self.bus.read_byte(self.address)
                 logger.debug(
                     "PCF8574 0x%02X: read current state = 0x%02X",
@@ -87,11 +99,12 @@ def write_port(self, port: int, state: int, verify: bool = True) -> bool:
                 )
 
             # Calculate new value with explicit masking to ensure valid byte
-            current = self.last_value & 0xFF
-            if state:
-                new_value = current | (1 << port)
-            else:
-                new_value = current & ~(1 << port)
+            new_value = self.last_value & 0xFF
+            for port, state in states.items():
+                if state:
+                    new_value |= 1 << port
+                else:
+                    new_value &= ~(1 << port)
             new_value &= 0xFF  # Ensure valid byte range
 
             # Write the new value
@@ -112,7 +125,8 @@ def write_port(self, port: int, state: int, verify: bool = True) -> bool:
                     return False
 
             self.last_value = new_value
-            self.port_states[port] = state
+            for port, state in states.items():
+                self.port_states[port] = state
 
         except OSError as ex:
             logger.error("PCF8574 write error: %s", ex)
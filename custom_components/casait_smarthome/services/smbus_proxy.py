@@ -8,7 +8,9 @@
 """
 
 import contextlib
+import functools
 import logging
+import random
 import socket
 import threading
 import time
@@ -27,6 +29,67 @@
 # Default configuration from environment variables
 DEFAULT_PORT = 8555
 DEFAULT_TIMEOUT = 2.0
+SOCKET_BUFFER_SIZE = 65536  # Fixed kernel socket buffers, skips auto-tuning warm-up during bursts
+RX_BUFFER_SIZE = 258  # Largest response frame: length byte, 255 payload bytes and CRC
+CACHED_FRAME_MAX_PAYLOAD = 4  # Commands up to write_byte_data reuse their prebuilt frame
+BLOCK_WRITE_SETTLE_TIME = 0.001  # Quiet time after a block write before the next frame
+RETRY_BACKOFF = 0.1  # Delay before the first command retry in seconds, tripled per attempt
+MAINTENANCE_BACKOFF = 2.0  # Delay before retrying a bridge that reported maintenance mode
+
+
+def _crc8_entry(value: int) -> int:
+    """Run the bitwise CRC8 (polynomial 0x07) over a single byte value."""
+    crc = value
+    for _ in range(8):
+        crc = ((crc << 1) ^ 0x07) & 0xFF if crc & 0x80 else (crc << 1) & 0xFF
+    return crc
+
+
+# Lookup table for the frame CRC8 (polynomial 0x07, init 0x00).
+# A single table on purpose: slicing-by-4 tables were measured slower in CPython
+# for every frame size the bridge accepts, the extra lookups cost more than the
+# loop iterations they save.
+_CRC8_TABLE = bytes(_crc8_entry(value) for value in range(256))
+
+
+def _calc_crc8(data: bytes | bytearray | memoryview) -> int:
+    """Compute CRC8 with polynomial 0x07 and init 0x00.
+
+    Kept in pure Python: the integration ships as source without a build step, and
+    with short commands served from cached frames only block writes and responses
+    reach this loop, at well under a microsecond per frame.
+    """
+
+    table = _CRC8_TABLE
+    crc = 0
+    for byte in data:
+        crc = table[crc ^ byte]
+    return crc
+
+
+def _build_frame(payload: tuple[int, ...]) -> bytearray:
+    """Frame a command as one contiguous [len][payload][crc8] buffer."""
+
+    frame = bytearray((len(payload), *payload, 0))
+    frame[-1] = _calc_crc8(memoryview(frame)[:-1])
+    return frame
+
+
+@functools.lru_cache(maxsize=512)
+def _cached_frame(payload: tuple[int, ...]) -> bytes:
+    """Return the frame of a short register command, built once per distinct payload.
+
+    Polling repeats the same few address/register commands, so their frames and
+    CRCs are looked up instead of rebuilt on every call.
+    """
+
+    return bytes(_build_frame(payload))
+
+
+def _frame(payload: tuple[int, ...]) -> bytes | bytearray:
+    """Frame a command, reusing cached frames for short commands."""
+
+    return _cached_frame(payload) if len(payload) <= CACHED_FRAME_MAX_PAYLOAD else _build_frame(payload)
 
 
 class SMBusProxyError(Exception):
@@ -75,16 +138,19 @@ def __init__(
         self.port = port or DEFAULT_PORT
         self.timeout = timeout or DEFAULT_TIMEOUT
         self._sock: socket.socket | None = None
-        self._io_lock = threading.Lock()
-        self._last_send: float = 0.0
+        self._io_lock = threading.Lock()  # Held only around a frame exchange
+        self._reconnect_lock = threading.Lock()  # Serializes reconnects, taken only on the rare path
+        self._next_send_ts: float = 0.0  # Earliest monotonic time for the next frame
         self._min_send_interval = 0.005  # 5 ms spacing to avoid flooding bridge
+        self._rx_buf = bytearray(RX_BUFFER_SIZE)
+        self._rx_view = memoryview(self._rx_buf)
         _LOGGER.debug(
             "Initializing SMBusProxy with host=%s, port=%s, timeout=%s",
             self.host,
             self.port,
             self.timeout,
         )
-        with self._io_lock:
+        with self._reconnect_lock:
             self._connect()
 
     def __enter__(self):
@@ -99,8 +165,7 @@ def __exit__(self, exc_type, exc_val, exc_tb):
     def _connect(self):
         """Establish TCP connection to the bridge.
 
-        Must be called while holding ``_io_lock`` (or during __init__
-        before any other thread can access the instance).
+        Must be called while holding ``_reconnect_lock``.
         """
         if self._sock is not None:
             return  # Already connected
@@ -110,6 +175,8 @@ def _connect(self):
             sock.settimeout(self.timeout)
             sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
             sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
             sock.connect((self.host, self.port))
             self._sock = sock
             _LOGGER.info("Connected to SMBus bridge at %s:%s", self.host, self.port)
@@ -121,134 +188,170 @@ def _connect(self):
     def _ensure_connected(self):
         """Ensure we have an active connection, reconnect if needed.
 
-        Must be called while holding ``_io_lock``.
+        The connected check is lock-free; only an actual reconnect takes
+        ``_reconnect_lock`` and checks again, so a single thread connects.
         """
         if self._sock is None:
-            self._connect()
+            with self._reconnect_lock:
+                if self._sock is None:
+                    self._connect()
+
+    @property
+    def connected(self) -> bool:
+        """Return True while a connection to the bridge is open."""
+        return self._sock is not None
 
     @staticmethod
-    def _calc_crc8(data: bytes) -> int:
-        """Compute CRC8 with polynomial 0x07 and init 0x00."""
+    def _backoff(attempt: int) -> None:
+        """Sleep before retrying, growing exponentially with jitter so clients do not retry in lockstep."""
 
-        crc = 0
-        for byte in data:
-            crc ^= byte
-            for _ in range(8):
-                crc = ((crc << 1) ^ 0x07) & 0xFF if crc & 0x80 else (crc << 1) & 0xFF
-        return crc
+        delay = RETRY_BACKOFF * 3**attempt
+        time.sleep(delay + random.uniform(0, delay / 2))
 
-    def _recv_exact(self, size: int) -> bytes:
-        """Receive exactly ``size`` bytes or raise."""
+    def _recv_exact(self, filled: int, size: int) -> None:
+        """Receive into the buffer until its first ``size`` bytes are filled or raise."""
 
         if self._sock is None:
             raise SMBusProxyError("Socket is not connected")
 
-        chunks = bytearray()
-        while len(chunks) < size:
+        view = self._rx_view
+        while filled < size:
             try:
-                chunk = self._sock.recv(size - len(chunks))
+                received = self._sock.recv_into(view[filled:size])
             except TimeoutError as err:
                 raise SMBusProxyError("Communication timeout") from err
-            if not chunk:
+            if not received:
                 raise SMBusProxyError("Communication error: empty response")
-            chunks.extend(chunk)
-        return bytes(chunks)
+            filled += received
 
     def _receive_frame(self) -> bytes:
         """Read a framed response [len][payload][crc8]."""
 
-        length_bytes = self._recv_exact(1)
-        frame_len = length_bytes[0]
-        payload = self._recv_exact(frame_len) if frame_len else b""
-        crc_recv = self._recv_exact(1)[0]
+        if self._sock is None:
+            raise SMBusProxyError("Socket is not connected")
 
-        frame = length_bytes + payload
-        crc_expected = self._calc_crc8(frame)
-        if crc_recv != crc_expected:
+        buf = self._rx_buf
+        view = self._rx_view
+        # Responses are tiny and usually arrive in one segment, read them with a single call
+        try:
+            filled = self._sock.recv_into(view)
+        except TimeoutError as err:
+            raise SMBusProxyError("Communication timeout") from err
+        if not filled:
+            raise SMBusProxyError("Communication error: empty response")
+
+        frame_end = buf[0] + 2
+        if filled < frame_end:
+            self._recv_exact(filled, frame_end)
+            filled = frame_end
+
+        if buf[frame_end - 1] != _calc_crc8(view[: frame_end - 1]):
             raise SMBusProxyError("CRC mismatch in bridge response")
-        return payload
+        if filled > frame_end:
+            # Strict request/response: anything after the frame is a late or duplicated
+            # response and must not be handed to the next command
+            _LOGGER.warning("Discarding %d unexpected bytes after bridge response", filled - frame_end)
+        return bytes(view[1 : frame_end - 1])
 
-    def _send_command(self, payload: bytes) -> bytes:
-        """Send a framed command and return payload of response."""
+    def _send_command(self, *payload: int) -> bytes:
+        """Send a framed command built from the given payload bytes and return payload of response."""
 
-        with self._io_lock:
-            for attempt in range(3):
-                self._ensure_connected()
-
-                try:
-                    if self._sock is None:
-                        raise SMBusProxyError("Socket connection failed")  # noqa: TRY301
-
-                    now = time.monotonic()
-                    delta = now - self._last_send
-                    if delta < self._min_send_interval:
-                        time.sleep(self._min_send_interval - delta)
-                    self._last_send = time.monotonic()
-
-                    frame = bytes([len(payload)]) + payload
-                    crc = self._calc_crc8(frame)
-                    self._sock.sendall(frame + bytes([crc]))
-                    response = self._receive_frame()
-
-                    # Bridge may signal maintenance; back off to avoid busy reconnect loops
-                    if len(response) >= 3 and response[:3] == b"\xff\xee\x01":
-                        self._reset_socket()
-                        time.sleep(2)
-                        raise SMBusProxyError("Bridge in maintenance mode")  # noqa: TRY301
-                except TimeoutError as e:
-                    _LOGGER.warning(
-                        "SMBus proxy communication timeout (attempt %d/%d)",
-                        attempt + 1,
-                        3,
-                    )
-                    self._reset_socket()
-                    if attempt < 2:
-                        time.sleep(1.0)
-                        continue
-                    raise SMBusProxyError("Communication timeout") from e
-                except SMBusProxyError as e:
-                    _LOGGER.warning(
-                        "SMBus proxy error (attempt %d/%d): %s",
-                        attempt + 1,
-                        3,
-                        e,
-                    )
-                    self._reset_socket()
-                    if attempt < 2:
-                        time.sleep(1.0)
-                        continue
-                    raise
-                except OSError as e:
-                    _LOGGER.warning(
-                        "SMBus proxy communication error (attempt %d/%d): %s",
-                        attempt + 1,
-                        3,
-                        e,
-                    )
-                    self._reset_socket()
-                    if attempt < 2:
-                        time.sleep(1.0)
-                        continue
-                    raise SMBusProxyError(f"Communication error: {e}") from e
+        # Frame the command once, so it leaves in a single write with TCP_NODELAY set
+        frame = _frame(payload)
+
+        sock = None
+        for attempt in range(3):
+            maintenance = False
+            self._ensure_connected()
+
+            try:
+                # Only the frame exchange is serialized, reconnects and back-off sleeps
+                # happen outside the lock so other callers are not held up by them
+                with self._io_lock:
+                    sock = self._sock
+                    if sock is None:
+                        error = "Socket connection failed"
+                    else:
+                        # One clock read when callers are already paced slower than the interval
+                        now = time.monotonic()
+                        if now < self._next_send_ts:
+                            time.sleep(self._next_send_ts - now)
+                            now = self._next_send_ts
+                        self._next_send_ts = now + self._min_send_interval
+
+                        sock.sendall(frame)
+                        response = self._receive_frame()
+
+                        # Bridge may signal maintenance; it gets a longer back-off to avoid busy reconnect loops
+                        maintenance = response[:3] == b"\xff\xee\x01"
+                        error = "Bridge in maintenance mode" if maintenance else None
+            except TimeoutError as e:
+                _LOGGER.warning(
+                    "SMBus proxy communication timeout (attempt %d/%d)",
+                    attempt + 1,
+                    3,
+                )
+                self._reset_socket(sock)
+                if attempt < 2:
+                    self._backoff(attempt)
+                    continue
+                raise SMBusProxyError("Communication timeout") from e
+            except SMBusProxyError as e:
+                error = str(e)
+            except OSError as e:
+                _LOGGER.warning(
+                    "SMBus proxy communication error (attempt %d/%d): %s",
+                    attempt + 1,
+                    3,
+                    e,
+                )
+                self._reset_socket(sock)
+                if attempt < 2:
+                    self._backoff(attempt)
+                    continue
+                raise SMBusProxyError(f"Communication error: {e}") from e
+
+            # Failures detected here are plain strings, an exception is only built
+            # once the retries are used up
+            if error is None:
+                return response
+            _LOGGER.warning(
+                "SMBus proxy error (attempt %d/%d): %s",
+                attempt + 1,
+                3,
+                error,
+            )
+            self._reset_socket(sock)
+            if attempt < 2:
+                if maintenance:
+                    time.sleep(MAINTENANCE_BACKOFF)
                 else:
-                    return response
-            return b""
+                    self._backoff(attempt)
+                continue
+            raise SMBusProxyError(error)
+        return b""
 
-    def _reset_socket(self) -> None:
-        """Close and clear the current socket so next call reconnects."""
+    def _reset_socket(self, sock: socket.socket | None) -> None:
+        """Close and clear ``sock`` so the next call reconnects.
 
-        if self._sock:
+        Does nothing if another thread already replaced the socket.
+        """
+
+        with self._io_lock:
+            if sock is None or sock is not self._sock:
+                return
             with contextlib.suppress(Exception):
-                self._sock.close()
-        self._sock = None
+                sock.close()
+            self._sock = None
 
     def close(self):
         """Close the connection to the bridge."""
-        if self._sock:
-            with contextlib.suppress(Exception):
-                self._sock.close()
-            self._sock = None
-            _LOGGER.debug("SMBus proxy connection closed")
+        with self._io_lock:
+            if self._sock:
+                with contextlib.suppress(Exception):
+                    self._sock.close()
+                self._sock = None
+                _LOGGER.debug("SMBus proxy connection closed")
 
     def write_quick(self, addr: int):
         """Perform a quick write to probe device presence.
@@ -280,7 +383,7 @@ def read_byte(self, addr: int) -> int:
             OSError: If read fails (matching smbus2 behavior)
         """
         try:
-            response = self._send_command(bytes([CMD_READ_BYTE, addr]))
+            response = self._send_command(CMD_READ_BYTE, addr)
             if len(response) >= 1 and response[0] == 0x00 and len(response) >= 2:
                 return response[1]
             raise OSError(f"Read byte failed for address 0x{addr:02X}")
@@ -298,7 +401,7 @@ def write_byte(self, addr: int, value: int):
             OSError: If write fails (matching smbus2 behavior)
         """
         try:
-            response = self._send_command(bytes([CMD_WRITE_BYTE, addr, value]))
+            response = self._send_command(CMD_WRITE_BYTE, addr, value)
             if len(response) >= 1 and response[0] == 0x00:
                 return
             raise OSError(f"Write byte failed for address 0x{addr:02X}")
@@ -319,7 +422,7 @@ def read_byte_data(self, addr: int, reg: int) -> int:
             OSError: If read fails (matching smbus2 behavior)
         """
         try:
-            response = self._send_command(bytes([CMD_READ_BYTE_DATA, addr, reg]))
+            response = self._send_command(CMD_READ_BYTE_DATA, addr, reg)
             if len(response) >= 1 and response[0] == 0x00 and len(response) >= 2:
                 return response[1]
             raise OSError(f"Read byte data failed for address 0x{addr:02X} register 0x{reg:02X}")
@@ -338,33 +441,37 @@ def write_byte_data(self, addr: int, reg: int, value: int):
             OSError: If write fails (matching smbus2 behavior)
         """
         try:
-            response = self._send_command(bytes([CMD_WRITE_BYTE_DATA, addr, reg, value]))
+            response = self._send_command(CMD_WRITE_BYTE_DATA, addr, reg, value)
             if len(response) >= 1 and response[0] == 0x00:
                 return
             raise OSError(f"Write byte data failed for address 0x{addr:02X} register 0x{reg:02X}")
         except SMBusProxyError as e:
             raise OSError(str(e)) from e
 
-    def write_i2c_block_data(self, i2c_addr: int, register: int, data: list):
+    def write_i2c_block_data(
+        self, i2c_addr: int, register: int, data: list, *, settle: float = BLOCK_WRITE_SETTLE_TIME
+    ) -> None:
         """Write a block of byte data to a given register.
 
         Args:
             i2c_addr: I2C address (7-bit)
             register: Start register
             data: List of bytes
-            force: Unused (for smbus2 API compatibility)
+            settle: Seconds the bus stays quiet after the write, 0 to skip
 
         Raises:
             OSError: If write fails (matching smbus2 behavior)
         """
         try:
             # Protocol: [CMD, ADDR, REG, DATA0, DATA1, ...]
-            packet = bytes([CMD_WRITE_I2C_BLOCK_DATA, i2c_addr, register]) + bytes(data)
-            response = self._send_command(packet)
+            response = self._send_command(CMD_WRITE_I2C_BLOCK_DATA, i2c_addr, register, *data)
             if len(response) >= 1 and response[0] == 0x00:
                 # Block writes (especially to dimmers) cause hardware transitions
-                # that generate electrical noise. Add settling time.
-                time.sleep(0.001)
+                # that generate electrical noise. Hold back the next frame for the
+                # settling time instead of blocking this caller.
+                if settle > 0:
+                    with self._io_lock:
+                        self._next_send_ts = max(self._next_send_ts, time.monotonic() + settle)
                 return
             raise OSError(f"Write i2c block data failed for address 0x{i2c_addr:02X} register 0x{register:02X}")
         except SMBusProxyError as e:
@@ -383,7 +490,7 @@ def set_debug(self, enabled: bool) -> bool:
             True if debug mode was set successfully
         """
         try:
-            response = self._send_command(bytes([CMD_SET_DEBUG, 1 if enabled else 0]))
+            response = self._send_command(CMD_SET_DEBUG, 1 if enabled else 0)
             return len(response) == 2 and response[0] == 0x00
         except SMBusProxyError:
             return False
@@ -392,7 +499,7 @@ def ping(self) -> bool:
         """Send a keep-alive ping to the bridge."""
 
         try:
-            response = self._send_command(bytes([CMD_PING]))
+            response = self._send_command(CMD_PING)
             return len(response) >= 3 and response[0] == 0x00 and response[1] == CMD_PING
         except SMBusProxyError:
             return False
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from datetime import timedelta
 import logging
 from typing import Any
 
@@ -26,6 +25,11 @@
 
 _LOGGER = logging.getLogger(__name__)
 
+# Port A/B output levels for every raw DM117 digital port value
+_RAW_TO_AB: tuple[tuple[bool, bool], ...] = tuple(
+    (bool(config.port_a), bool(config.port_b)) for config in map(PortConfig.from_raw, range(256))
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -120,8 +124,10 @@ def _update_state(self) -> None:
     @callback
     def _handle_state_update(self) -> None:
         """Handle updated data from shared poller."""
+        previous = (self._attr_is_on, self.available)
         self._update_state()
-        self.async_write_ha_state()
+        if (self._attr_is_on, self.available) != previous:
+            self.async_write_ha_state()
 
     async def async_added_to_hass(self) -> None:
         """Register callbacks when entity is added to hass."""
@@ -140,10 +146,8 @@ async def async_turn_off(self, **kwargs: Any) -> None:
 
     async def _async_set_state(self, state: int) -> None:
         """Set the state of the switch."""
-        device = self._api.im117_om117.get(self._address)
-        if device:
-            async with self._api.lock:
-                await self.hass.async_add_executor_job(device.write_port, self._hardware_port, state)
+        if self._address in self._api.im117_om117:
+            await self._api.async_write_pcf8574_ports(self._address, {self._hardware_port: state})
             await self._api.async_force_refresh()
 
     @property
@@ -202,14 +206,15 @@ def _update_state(self) -> None:
             return
 
         raw_value = states[self._port]
-        port_config = PortConfig.from_raw(raw_value)
-        value = port_config.port_a if self._channel == 0 else port_config.port_b
-        self._attr_is_on = bool(value)
+        port_a, port_b = _RAW_TO_AB[raw_value] if 0 <= raw_value <= 0xFF else (False, False)
+        self._attr_is_on = port_a if self._channel == 0 else port_b
 
     @callback
     def _handle_state_update(self) -> None:
+        previous = (self._attr_is_on, self.available)
         self._update_state()
-        self.async_write_ha_state()
+        if (self._attr_is_on, self.available) != previous:
+            self.async_write_ha_state()
 
     async def async_added_to_hass(self) -> None:
         """Register callbacks when entity is added to hass."""
@@ -254,8 +259,7 @@ class CasaITDS2413Switch(SwitchEntity):
     """Switch entity for DS2413 channels configured as outputs."""
 
     _attr_has_entity_name = False
-    _attr_should_poll = True
-    SCAN_INTERVAL = timedelta(seconds=1)
+    _attr_should_poll = False
 
     def __init__(
         self,
@@ -274,17 +278,36 @@ def __init__(
         self._attr_unique_id = f"{device_id}_channel_{channel}_output"
         self._attr_name = f"{device_id} channel {channel_name} output"
         self._attr_device_info = _build_onewire_device_info(device_id, meta)
+        self._update_state()
 
-    async def async_update(self) -> None:
-        """Poll current DS2413 output state."""
-
-        self._attr_available = False
-        state = await self._api.read_ds2413_state(self._device_id, self._channel, invert=False)
-        if state is None:
+    def _update_state(self) -> None:
+        """Update the state from the shared poller's DS2413 states."""
+        states = self._api.ds2413_states.get(self._device_id)
+        if states is None:
+            self._attr_available = False
             return
-        self._attr_is_on = state
+        self._attr_is_on = states[self._channel]
         self._attr_available = True
 
+    @callback
+    def _handle_state_update(self) -> None:
+        """Handle updated data from shared poller."""
+        previous = (self._attr_is_on, self._attr_available)
+        self._update_state()
+        if (self._attr_is_on, self._attr_available) != previous:
+            self.async_write_ha_state()
+
+    async def async_added_to_hass(self) -> None:
+        """Register with the shared poller when entity is added to hass."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._api.track_ds2413(self._device_id))
+        self.async_on_remove(async_dispatcher_connect(self.hass, SIGNAL_STATE_UPDATED, self._handle_state_update))
+
+    async def async_update(self) -> None:
+        """Update the state from the shared poller's DS2413 states."""
+
+        self._update_state()
+
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the DS2413 output on."""
 
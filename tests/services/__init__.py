@@ -0,0 +1 @@
+"""Tests for the casaIT Smart Home services."""
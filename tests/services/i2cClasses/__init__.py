@@ -0,0 +1 @@
+"""Tests for the I2C device classes."""
@@ -0,0 +1,202 @@
+"""Fake DS2482 bridge and 1-Wire devices for the I2C device class tests."""
+
+from __future__ import annotations
+
+from custom_components.casait_smarthome.services.i2cClasses.ds2482 import DS2482
+
+
+def dallas_crc8(data: bytes) -> int:
+    """Bitwise Dallas/Maxim CRC8, the reference for the table driven implementation."""
+    crc = 0
+    for byte in data:
+        crc ^= byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0x8C if crc & 0x01 else crc >> 1
+    return crc
+
+
+def make_rom(family_code: int, serial: int) -> bytes:
+    """Build a ROM code with a valid CRC byte."""
+    rom = bytes((family_code, *serial.to_bytes(6, "little")))
+    return rom + bytes((dallas_crc8(rom),))
+
+
+class FakeOneWireDevice:
+    """A 1-Wire slave that receives the function command bytes after MATCH ROM."""
+
+    def __init__(self, rom: bytes) -> None:
+        """Initialize the device with its ROM code."""
+        self.rom = rom
+        self.commands: list[int] = []
+        self._command: int | None = None
+        self._args = bytearray()
+        self._out = bytearray()
+
+    def reset(self) -> None:
+        """Drop the current function command on a 1-Wire reset."""
+        self._command = None
+        self._args.clear()
+        self._out.clear()
+
+    def write_byte(self, byte: int) -> None:
+        """Receive a byte after the device was selected."""
+        if self._command is None:
+            self._command = byte
+            self.commands.append(byte)
+            self.on_command(byte)
+        else:
+            self._args.append(byte)
+            self.on_argument(self._command, self._args)
+
+    def read_byte(self) -> int:
+        """Send the next response byte, 0xFF once the response is exhausted."""
+        return self._out.pop(0) if self._out else 0xFF
+
+    def on_command(self, command: int) -> None:
+        """Handle a function command byte."""
+
+    def on_argument(self, command: int, args: bytearray) -> None:
+        """Handle an argument byte of the current function command."""
+
+
+class FakeDS2438(FakeOneWireDevice):
+    """DS2438 with page 0 of its scratchpad and instant conversions."""
+
+    def __init__(
+        self,
+        rom: bytes,
+        *,
+        vdd: float = 5.0,
+        vad: float = 2.5,
+        vse: float = 0.01,
+        temperature: float = 21.5,
+    ) -> None:
+        """Initialize the device with the values its conversions produce."""
+        super().__init__(rom)
+        self.vdd = vdd
+        self.vad = vad
+        self.vse = vse
+        self.temperature = temperature
+        self.corrupt_reads = 0  # Number of following scratchpad reads sent with a wrong CRC
+        self.page0 = bytearray(8)
+
+    def on_command(self, command: int) -> None:
+        """Run conversions as soon as they are started."""
+        if command == 0xB4:  # Convert voltage, input selected by the AD bit of the config
+            volts = self.vdd if self.page0[0] & 0x08 else self.vad
+            self.page0[3:5] = round(volts * 100).to_bytes(2, "little")
+            self.page0[5:7] = round(self.vse * 1000 / 0.2441).to_bytes(2, "little")
+        elif command == 0x44:  # Convert temperature
+            self.page0[1:3] = round(self.temperature * 256).to_bytes(2, "little")
+
+    def on_argument(self, command: int, args: bytearray) -> None:
+        """Handle the page and data bytes of the memory commands."""
+        if command == 0x4E and len(args) == 2:  # Write scratchpad: page, config byte
+            self.page0[0] = args[1]
+        elif command == 0xBE and len(args) == 1:  # Read scratchpad: page
+            crc = dallas_crc8(self.page0)
+            if self.corrupt_reads:
+                self.corrupt_reads -= 1
+                crc ^= 0xFF
+            self._out[:] = self.page0 + bytes((crc,))
+
+
+class FakeDS2482Bus:
+    """I2C bus with a DS2482-100 that drives a simulated 1-Wire bus.
+
+    Every 1-Wire operation completes instantly, so 1-Wire Busy is never set.
+    """
+
+    def __init__(self, devices: list[FakeOneWireDevice] | None = None) -> None:
+        """Initialize the bus with the devices attached to the 1-Wire side."""
+        self.devices = list(devices or [])
+        self.operations = 0  # 1-Wire resets, byte transfers and triplets
+        self._status = 0
+        self._data = 0xFF
+        self._config = 0
+        self._pointer = DS2482.REG_STATUS
+        self._mode = "idle"
+        self._match = bytearray()
+        self._selected: FakeOneWireDevice | None = None
+        self._searching: list[FakeOneWireDevice] = []
+        self._search_bit = 0
+
+    def write_byte(self, addr: int, value: int) -> None:
+        """Handle the DS2482 commands without parameter."""
+        if value == DS2482.CMD_RESET:
+            self._status = DS2482.STATUS_RST
+        elif value == DS2482.CMD_1WIRE_RESET:
+            self._wire_reset()
+        elif value == DS2482.CMD_1WIRE_READ_BYTE:
+            self.operations += 1
+            self._data = self._selected.read_byte() if self._mode == "function" and self._selected else 0xFF
+        self._pointer = DS2482.REG_STATUS
+
+    def write_byte_data(self, addr: int, register: int, value: int) -> None:
+        """Handle the DS2482 commands with a parameter byte."""
+        if register == DS2482.CMD_SET_READ_PTR:
+            self._pointer = value
+            return
+
+        if register == DS2482.CMD_WRITE_CONFIG:
+            self._config = value & 0x0F
+            self._pointer = DS2482.REG_CONFIG
+            return
+
+        self._pointer = DS2482.REG_STATUS
+        if register == DS2482.CMD_1WIRE_WRITE_BYTE:
+            self.operations += 1
+            self._wire_write(value)
+        elif register == DS2482.CMD_1WIRE_TRIPLET:
+            self.operations += 1
+            self._triplet(bool(value & 0x80))
+
+    def read_byte(self, addr: int) -> int:
+        """Read the register selected by the read pointer."""
+        if self._pointer == DS2482.REG_DATA:
+            return self._data
+        if self._pointer == DS2482.REG_CONFIG:
+            return self._config
+        return self._status
+
+    def _wire_reset(self) -> None:
+        self.operations += 1
+        self._status = DS2482.STATUS_PPD if self.devices else 0
+        self._mode = "rom"
+        self._selected = None
+        for device in self.devices:
+            device.reset()
+
+    def _wire_write(self, byte: int) -> None:
+        if self._mode == "rom":
+            if byte == 0xF0:  # Search ROM
+                self._mode = "search"
+                self._searching = list(self.devices)
+                self._search_bit = 0
+            elif byte == 0x55:  # Match ROM
+                self._mode = "match"
+                self._match.clear()
+        elif self._mode == "match":
+            self._match.append(byte)
+            if len(self._match) == 8:
+                self._selected = next((d for d in self.devices if d.rom == self._match), None)
+                self._mode = "function"
+        elif self._mode == "function" and self._selected is not None:
+            self._selected.write_byte(byte)
+
+    def _triplet(self, direction: bool) -> None:
+        byte_index, bit_index = divmod(self._search_bit, 8)
+        bits = [(device.rom[byte_index] >> bit_index) & 1 for device in self._searching]
+
+        # Open drain bus: a read slot only returns 1 if no device pulls it low
+        id_bit = all(bits)
+        cmp_id_bit = not any(bits)
+        taken = id_bit if id_bit != cmp_id_bit else (direction or id_bit)
+
+        self._searching = [d for d, bit in zip(self._searching, bits, strict=True) if bit == taken]
+        self._search_bit += 1
+        self._status = (
+            (DS2482.STATUS_SBR if id_bit else 0)
+            | (DS2482.STATUS_TSB if cmp_id_bit else 0)
+            | (DS2482.STATUS_DIR if taken else 0)
+        )
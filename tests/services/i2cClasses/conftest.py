@@ -0,0 +1,34 @@
+"""Fixtures for the I2C device class tests."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.casait_smarthome.services.i2cClasses import ds2438
+from custom_components.casait_smarthome.services.i2cClasses.oneWireBus import OneWireBus
+
+from .common import FakeDS2438, FakeDS2482Bus, make_rom
+
+
+@pytest.fixture
+def fake_ds2438() -> FakeDS2438:
+    """Return a DS2438 attached to the fake 1-Wire bus."""
+    return FakeDS2438(make_rom(0x26, 0x0000_0A0B_0C0D))
+
+
+@pytest.fixture
+def fake_i2c_bus(fake_ds2438: FakeDS2438) -> FakeDS2482Bus:
+    """Return an I2C bus with a DS2482 and the fake DS2438."""
+    return FakeDS2482Bus([fake_ds2438])
+
+
+@pytest.fixture
+def onewire_bus(fake_i2c_bus: FakeDS2482Bus) -> OneWireBus:
+    """Return a OneWireBus that has scanned the fake 1-Wire bus."""
+    return OneWireBus(fake_i2c_bus, 0x18)
+
+
+@pytest.fixture
+def instant_conversions(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Let DS2438 state machine steps follow each other without waiting."""
+    monkeypatch.setattr(ds2438, "CONVERSION_TIME", 0)
@@ -0,0 +1,171 @@
+"""Tests for the DS2438 conversion state machine."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.casait_smarthome.services.i2cClasses import ds2438
+from custom_components.casait_smarthome.services.i2cClasses.ds2438 import (
+    CACHE_TIMEOUT,
+    MAX_TTL_FACTOR,
+    ConversionPhase,
+    ConversionState,
+    DS2438Reading,
+)
+from custom_components.casait_smarthome.services.i2cClasses.oneWireBus import OneWireBus
+
+from .common import FakeDS2438, FakeDS2482Bus
+
+pytestmark = [pytest.mark.unit, pytest.mark.usefixtures("instant_conversions")]
+
+MAX_TICKS = 10
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Replace the monotonic clock of the DS2438 module with a settable one."""
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(ds2438, "time", SimpleNamespace(monotonic=lambda: clock.now))
+    return clock
+
+
+def _run_cycle(bus: OneWireBus, device_id: str) -> int:
+    """Tick until the state machine is idle again and return the number of ticks."""
+    for ticks in range(1, MAX_TICKS + 1):
+        assert bus.ds2438.tick(device_id)
+        if bus.ds2438._get_state(device_id).state is ConversionState.IDLE:
+            return ticks
+    pytest.fail("Conversion cycle did not complete")
+
+
+def test_tick_publishes_complete_reading(
+    onewire_bus: OneWireBus, fake_ds2438: FakeDS2438, clock: SimpleNamespace
+) -> None:
+    """A full cycle publishes one reading with all channels."""
+    device_id = fake_ds2438.rom.hex()
+    assert onewire_bus.ds2438.get_reading(device_id) is None
+
+    _run_cycle(onewire_bus, device_id)
+
+    reading = onewire_bus.ds2438.get_reading(device_id)
+    assert reading == DS2438Reading(
+        vdd=pytest.approx(5.0),
+        vad=pytest.approx(2.5),
+        vse=pytest.approx(0.01, abs=0.0003),
+        temperature=pytest.approx(21.5),
+        timestamp=clock.now,
+    )
+    assert onewire_bus.ds2438.get_cached_reading(device_id) is reading
+
+
+def test_get_reading_does_not_touch_the_bus(
+    onewire_bus: OneWireBus, fake_i2c_bus: FakeDS2482Bus, fake_ds2438: FakeDS2438
+) -> None:
+    """Reading the published values never starts a conversion."""
+    operations = fake_i2c_bus.operations
+
+    assert onewire_bus.ds2438.get_reading(fake_ds2438.rom.hex()) is None
+    assert onewire_bus.ds2438.get_cached_reading(fake_ds2438.rom.hex()) is None
+    assert fake_i2c_bus.operations == operations
+
+
+def test_fresh_reading_skips_conversion(
+    onewire_bus: OneWireBus, fake_i2c_bus: FakeDS2482Bus, fake_ds2438: FakeDS2438, clock: SimpleNamespace
+) -> None:
+    """No bus traffic happens while every channel is within its TTL."""
+    device_id = fake_ds2438.rom.hex()
+    _run_cycle(onewire_bus, device_id)
+    operations = fake_i2c_bus.operations
+
+    clock.now += CACHE_TIMEOUT - 1
+    assert onewire_bus.ds2438.tick(device_id)
+    assert fake_i2c_bus.operations == operations
+
+
+def test_only_expired_channels_are_converted(
+    onewire_bus: OneWireBus, fake_ds2438: FakeDS2438, clock: SimpleNamespace
+) -> None:
+    """A cycle for an expired VAD channel leaves VDD and temperature alone."""
+    device_id = fake_ds2438.rom.hex()
+    _run_cycle(onewire_bus, device_id)
+    state = onewire_bus.ds2438._get_state(device_id)
+    first = state.reading
+    assert first is not None
+
+    state.refreshed_vad -= CACHE_TIMEOUT
+    assert state.expired_phases(clock.now) == ConversionPhase.VAD
+
+    fake_ds2438.commands.clear()
+    fake_ds2438.vad = 3.3
+    fake_ds2438.temperature = 30.0
+    clock.now += 1
+    _run_cycle(onewire_bus, device_id)
+
+    # VAD config write and conversion, then recall and read of page 0
+    assert fake_ds2438.commands == [0x4E, 0xB4, 0xB8, 0xBE]
+    reading = onewire_bus.ds2438.get_reading(device_id)
+    assert reading is not None
+    assert reading.vad == pytest.approx(3.3)
+    assert reading.vdd == first.vdd
+    assert reading.temperature == first.temperature
+
+
+def test_failed_read_resets_and_next_cycle_recovers(
+    onewire_bus: OneWireBus, fake_ds2438: FakeDS2438, clock: SimpleNamespace
+) -> None:
+    """A CRC error fails the step, the next ticks start over and publish a reading."""
+    device_id = fake_ds2438.rom.hex()
+    fake_ds2438.corrupt_reads = 1
+
+    results = [onewire_bus.ds2438.tick(device_id) for _ in range(3)]
+    assert results == [True, True, False]
+    assert onewire_bus.ds2438._get_state(device_id).state is ConversionState.IDLE
+    assert onewire_bus.ds2438.get_reading(device_id) is None
+
+    _run_cycle(onewire_bus, device_id)
+
+    assert onewire_bus.ds2438.get_reading(device_id) is not None
+
+
+def test_missing_device_fails_tick(onewire_bus: OneWireBus, clock: SimpleNamespace) -> None:
+    """A device that is not on the bus fails its conversion step."""
+    assert onewire_bus.ds2438.tick("26ffffffffffffff")
+    assert not onewire_bus.ds2438.tick("26ffffffffffffff")
+    assert onewire_bus.ds2438.get_reading("26ffffffffffffff") is None
+
+
+def test_stable_values_extend_the_ttl(onewire_bus: OneWireBus, fake_ds2438: FakeDS2438, clock: SimpleNamespace) -> None:
+    """The TTL of a channel doubles while it is stable and resets when it changes."""
+    device_id = fake_ds2438.rom.hex()
+    state = onewire_bus.ds2438._get_state(device_id)
+    _run_cycle(onewire_bus, device_id)
+    assert state.ttl_temp == CACHE_TIMEOUT
+
+    for expected in (2 * CACHE_TIMEOUT, 4 * CACHE_TIMEOUT, MAX_TTL_FACTOR * CACHE_TIMEOUT):
+        clock.now += state.ttl_temp
+        _run_cycle(onewire_bus, device_id)
+        assert state.ttl_temp == expected
+
+    fake_ds2438.temperature += 1
+    clock.now += state.ttl_temp
+    _run_cycle(onewire_bus, device_id)
+    assert state.ttl_temp == CACHE_TIMEOUT
+
+
+@pytest.mark.parametrize(
+    ("ttl", "previous", "value", "expected"),
+    [
+        (60, None, 20.0, 60),  # First reading
+        (60, 20.0, None, 60),  # Missing value
+        (60, 20.0, 20.1, 120),  # Within tolerance
+        (120, 20.0, 20.1, 240),
+        (240, 20.0, 20.1, 240),  # Capped at MAX_TTL_FACTOR
+        (240, 20.0, 21.0, 60),  # Changed
+        (10, 20.0, 20.0, 120),  # Never shorter than the base before doubling
+    ],
+)
+def test_next_ttl(ttl: float, previous: float | None, value: float | None, expected: float) -> None:
+    """The adaptive TTL doubles on stable values and falls back to the base on change."""
+    assert ds2438._next_ttl(ttl, previous, value, ds2438.TEMP_TOLERANCE, 60) == expected
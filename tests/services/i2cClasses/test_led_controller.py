@@ -0,0 +1,133 @@
+"""Tests for the LED controller packet layout and config cache."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.casait_smarthome.services.i2cClasses import led_controller
+from custom_components.casait_smarthome.services.i2cClasses.led_controller import (
+    CACHE_TIMEOUT,
+    AnimationMode,
+    LEDConfig,
+    LEDController,
+)
+
+pytestmark = pytest.mark.unit
+
+DEVICE_ID = "19000000000000aa"
+
+
+class FakeBridge:
+    """DS28E17 stand-in that keeps the last written LED registers."""
+
+    def __init__(self) -> None:
+        """Initialize the bridge with empty registers."""
+        self.writes: list[bytes] = []
+        self.registers = b""
+        self.fail_writes = False
+
+    def write_data(self, device_id: str, address: int, data: bytes) -> bool:
+        """Store the written registers, the first byte being the start register."""
+        if self.fail_writes:
+            return False
+        self.writes.append(bytes(data))
+        self.registers = bytes(data[1:])
+        return True
+
+    def read_data(self, device_id: str, address: int, num_bytes: int) -> bytes | None:
+        """Return the registers from register 0 on."""
+        return self.registers[:num_bytes]
+
+
+@pytest.fixture
+def bridge() -> FakeBridge:
+    """Return the fake DS28E17 bridge."""
+    return FakeBridge()
+
+
+@pytest.fixture
+def controller(bridge: FakeBridge, monkeypatch: pytest.MonkeyPatch) -> LEDController:
+    """Return an LED controller talking to the fake bridge."""
+    monkeypatch.setattr(led_controller, "WRITE_RETRY_DELAY", 0)
+    controller = LEDController(SimpleNamespace())
+    controller.bridge = bridge
+    return controller
+
+
+@pytest.fixture
+def config() -> LEDConfig:
+    """Return a configuration using every field."""
+    config = LEDConfig(
+        led_count=60,
+        state=True,
+        brightness=200,
+        animation=AnimationMode.PULSE,
+        animation_speed=17,
+        colors=bytes(range(1, 16)),
+    )
+    config.set_color(4, 0xAA, 0xBB, 0xCC)
+    return config
+
+
+def test_write_packet_layout(controller: LEDController, bridge: FakeBridge, config: LEDConfig) -> None:
+    """The write packet starts at register 0 followed by the config and color bytes."""
+    assert controller.write_config(DEVICE_ID, config)
+
+    assert bridge.writes == [bytes((0x00, 60, 1, 200, 3, 17, *range(1, 13), 0xAA, 0xBB, 0xCC))]
+
+
+def test_read_round_trip(controller: LEDController, config: LEDConfig) -> None:
+    """A config read back after writing it equals the written config."""
+    assert controller.write_config(DEVICE_ID, config)
+
+    read = controller.read_config(DEVICE_ID, use_cache=False)
+
+    assert read == config
+    assert read is not config
+    assert read.get_color(4) == (0xAA, 0xBB, 0xCC)
+
+
+def test_read_rejects_unknown_animation(controller: LEDController, bridge: FakeBridge) -> None:
+    """A response with an unknown animation code is not accepted."""
+    bridge.registers = bytes((30, 1, 100, 99, 0, *bytes(15)))
+
+    assert controller.read_config(DEVICE_ID, use_cache=False) is None
+
+
+def test_unchanged_write_is_skipped(controller: LEDController, bridge: FakeBridge, config: LEDConfig) -> None:
+    """Writing the cached configuration again does not touch the bus."""
+    assert controller.write_config(DEVICE_ID, config)
+    assert controller.write_config(DEVICE_ID, replace(config))
+
+    assert len(bridge.writes) == 1
+
+
+def test_failed_write_invalidates_cache(controller: LEDController, bridge: FakeBridge, config: LEDConfig) -> None:
+    """A failed write drops the cached configuration."""
+    assert controller.write_config(DEVICE_ID, config)
+    bridge.fail_writes = True
+
+    assert not controller.write_config(DEVICE_ID, replace(config, brightness=10))
+    assert controller.get_cached_config(DEVICE_ID) is None
+
+
+def test_expired_config_is_served_as_stale(
+    controller: LEDController, config: LEDConfig, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """An expired config stays available as stale for one more cache period."""
+    clock = SimpleNamespace(now=0)
+    monkeypatch.setattr(led_controller, "time", SimpleNamespace(monotonic_ns=lambda: clock.now))
+    assert controller.write_config(DEVICE_ID, config)
+
+    assert controller.get_cached_config(DEVICE_ID) == config
+    assert controller.get_stale_config(DEVICE_ID) is None
+
+    clock.now = CACHE_TIMEOUT * 1_000_000_000
+    assert controller.get_cached_config(DEVICE_ID) is None
+    assert controller.get_stale_config(DEVICE_ID) == config
+
+    clock.now = 2 * CACHE_TIMEOUT * 1_000_000_000
+    assert controller.get_stale_config(DEVICE_ID) is None
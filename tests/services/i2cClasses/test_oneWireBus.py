@@ -0,0 +1,105 @@
+"""Tests for the 1-Wire bus scan and CRC helpers."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from custom_components.casait_smarthome.services.i2cClasses.oneWireBus import OneWireBus
+
+from .common import FakeDS2438, FakeDS2482Bus, FakeOneWireDevice, dallas_crc8, make_rom
+
+pytestmark = pytest.mark.unit
+
+
+def _bitwise_crc16(data: bytes) -> int:
+    """Bitwise CRC16 with reflected polynomial 0xA001, the reference for the lookup table."""
+    crc = 0
+    for byte in data:
+        crc ^= byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xA001 if crc & 0x01 else crc >> 1
+    return crc
+
+
+def _random_payloads() -> list[bytes]:
+    rng = random.Random(0x2482)
+    return [bytes(rng.randrange(256) for _ in range(length)) for length in range(40) for _ in range(8)]
+
+
+def test_crc8_table_matches_bitwise() -> None:
+    """The CRC8 lookup table gives the same result as the bitwise algorithm."""
+    for data in _random_payloads():
+        assert OneWireBus._calc_crc8(data) == dallas_crc8(data)
+
+
+def test_crc16_table_matches_bitwise() -> None:
+    """The CRC16 lookup table gives the same result as the bitwise algorithm."""
+    for data in _random_payloads():
+        assert OneWireBus.calc_crc16(data) == _bitwise_crc16(data)
+
+
+def test_verify_crc8_by_residue(onewire_bus: OneWireBus) -> None:
+    """Data followed by its CRC byte verifies, a flipped bit does not."""
+    data = bytes(range(8))
+    framed = data + bytes((dallas_crc8(data),))
+
+    assert onewire_bus.verify_crc8(framed)
+    assert onewire_bus.verify_crc8(data, dallas_crc8(data))
+    assert not onewire_bus.verify_crc8(bytes((framed[0] ^ 0x01,)) + framed[1:])
+
+
+def test_triplet_search_finds_all_roms() -> None:
+    """The triplet ROM search enumerates every device on the bus."""
+    roms = [
+        make_rom(0x28, 0x0000_0000_0001),
+        make_rom(0x28, 0x0000_0000_0002),  # Differs from the previous ROM in the serial only
+        make_rom(0x28, 0x8000_0000_0001),
+        make_rom(0x26, 0x0000_1234_5678),
+        make_rom(0x3A, 0x00FF_FFFF_FFFF),
+        make_rom(0x19, 0x0000_0000_0000),
+    ]
+    bus = OneWireBus(FakeDS2482Bus([FakeOneWireDevice(rom) for rom in roms]), 0x18)
+
+    assert set(bus.devices) == {rom.hex() for rom in roms}
+    for rom in roms:
+        entry = bus.devices[rom.hex()]
+        assert entry.rom == rom
+        assert entry.rom_hex == rom.hex()
+        assert entry.family_code == rom[0]
+        assert entry.match_rom == bytes((OneWireBus.CMD_MATCH_ROM,)) + rom
+    assert bus.devices[roms[0].hex()].device_type == "DS18XB20"
+    assert bus.devices[roms[3].hex()].device_type == "DS2438"
+    assert bus.devices[roms[4].hex()].device_type == "DS2413"
+    assert bus.devices[roms[5].hex()].device_type == "DS28E17"
+
+
+def test_triplet_search_skips_rom_with_bad_crc() -> None:
+    """A ROM with a wrong CRC byte is not reported as a device."""
+    good = make_rom(0x28, 0x0000_0000_0001)
+    bad = make_rom(0x28, 0x0000_0000_0002)
+    bad = bad[:7] + bytes((bad[7] ^ 0xFF,))
+
+    bus = OneWireBus(FakeDS2482Bus([FakeOneWireDevice(good), FakeOneWireDevice(bad)]), 0x18)
+
+    assert set(bus.devices) == {good.hex()}
+
+
+def test_scan_without_presence_pulse_suspends_rescans() -> None:
+    """A bus without presence pulse finds nothing and is not rescanned right away."""
+    fake_bus = FakeDS2482Bus()
+    bus = OneWireBus(fake_bus, 0x18)
+    operations = fake_bus.operations
+
+    assert bus.devices == {}
+    assert bus.scan_devices(force=True) == {}
+    assert fake_bus.operations == operations
+
+
+def test_select_device_writes_match_rom(onewire_bus: OneWireBus, fake_ds2438: FakeDS2438) -> None:
+    """Selecting a device addresses it with MATCH ROM."""
+    assert onewire_bus.select_device(fake_ds2438.rom.hex())
+
+    onewire_bus.bridge.wire_write_byte(0x44)
+    assert fake_ds2438.commands == [0x44]
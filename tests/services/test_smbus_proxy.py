@@ -0,0 +1,167 @@
+"""Tests for the SMBus TCP proxy client."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import random
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.casait_smarthome.services import smbus_proxy
+from custom_components.casait_smarthome.services.smbus_proxy import SMBus
+
+pytestmark = pytest.mark.unit
+
+
+def _bitwise_crc8(data: bytes) -> int:
+    """Bitwise CRC8 (polynomial 0x07), the reference for the lookup table."""
+    crc = 0
+    for byte in data:
+        crc ^= byte
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x07) & 0xFF if crc & 0x80 else (crc << 1) & 0xFF
+    return crc
+
+
+def _response(*payload: int) -> bytes:
+    frame = bytes((len(payload), *payload))
+    return frame + bytes((_bitwise_crc8(frame),))
+
+
+class FakeSocket:
+    """Socket that answers each sent frame with the next scripted list of segments."""
+
+    def __init__(self, replies: list[list[bytes]]) -> None:
+        """Initialize the socket with the segments to receive per request."""
+        self.replies = replies
+        self.sent: list[bytes] = []
+        self.closed = False
+        self._segments: list[bytes] = []
+
+    def settimeout(self, timeout: float) -> None:
+        """Accept the timeout."""
+
+    def setsockopt(self, *args: int) -> None:
+        """Accept socket options."""
+
+    def connect(self, address: tuple[str, int]) -> None:
+        """Pretend to connect."""
+
+    def close(self) -> None:
+        """Mark the socket closed."""
+        self.closed = True
+
+    def sendall(self, data: bytes) -> None:
+        """Record the frame and queue its reply."""
+        self.sent.append(bytes(data))
+        self._segments = list(self.replies.pop(0)) if self.replies else []
+
+    def recv_into(self, buffer: memoryview) -> int:
+        """Receive the next queued segment, up to the size of ``buffer``."""
+        if not self._segments:
+            raise TimeoutError
+        segment = self._segments.pop(0)
+        size = min(len(segment), len(buffer))
+        buffer[:size] = segment[:size]
+        if size < len(segment):
+            self._segments.insert(0, segment[size:])
+        return size
+
+
+@pytest.fixture
+def connect(monkeypatch: pytest.MonkeyPatch) -> Callable[[list[list[bytes]]], tuple[SMBus, list[FakeSocket]]]:
+    """Return a factory for an SMBus whose connections are fake sockets sharing one reply script."""
+    monkeypatch.setattr(smbus_proxy, "RETRY_BACKOFF", 0)
+
+    def _connect(replies: list[list[bytes]]) -> tuple[SMBus, list[FakeSocket]]:
+        sockets: list[FakeSocket] = []
+
+        def _socket(*args: int) -> FakeSocket:
+            sockets.append(FakeSocket(replies))
+            return sockets[-1]
+
+        monkeypatch.setattr(smbus_proxy.socket, "socket", _socket)
+        bus = SMBus(1, "127.0.0.1", 8555)
+        bus._min_send_interval = 0
+        return bus, sockets
+
+    return _connect
+
+
+def test_crc8_table_matches_bitwise() -> None:
+    """The frame CRC8 lookup table gives the same result as the bitwise algorithm."""
+    rng = random.Random(0x07)
+    for length in range(64):
+        data = bytes(rng.randrange(256) for _ in range(length))
+        assert smbus_proxy._calc_crc8(data) == _bitwise_crc8(data)
+
+
+def test_frames_carry_length_and_crc() -> None:
+    """Cached and freshly built frames have the same layout."""
+    short = (smbus_proxy.CMD_READ_BYTE_DATA, 0x20, 0x01)
+    long = (smbus_proxy.CMD_WRITE_I2C_BLOCK_DATA, 0x20, 0x00, 3, 1, 2, 3)
+
+    assert smbus_proxy._frame(short) == _response(*short)
+    assert smbus_proxy._frame(short) is smbus_proxy._frame(short)
+    assert smbus_proxy._frame(long) == _response(*long)
+
+
+def test_response_split_across_segments(connect) -> None:
+    """A response arriving in several segments is reassembled."""
+    response = _response(0x00, 0x42)
+    bus, _ = connect([[response[:1], response[1:3], response[3:]]])
+
+    assert bus.read_byte_data(0x20, 0x01) == 0x42
+
+
+def test_trailing_bytes_are_discarded(connect, caplog: pytest.LogCaptureFixture) -> None:
+    """Bytes after a complete response are dropped instead of answering the next command."""
+    bus, _ = connect([[_response(0x00, 0x11) + _response(0x00, 0x99)], [_response(0x00, 0x22)]])
+
+    assert bus.read_byte_data(0x20, 0x01) == 0x11
+    assert "Discarding 4 unexpected bytes" in caplog.text
+    assert bus.read_byte_data(0x20, 0x02) == 0x22
+
+
+def test_crc_mismatch_reconnects_and_retries(connect) -> None:
+    """A corrupted response resets the connection and the command is sent again."""
+    corrupted = bytearray(_response(0x00, 0x42))
+    corrupted[-1] ^= 0xFF
+    bus, sockets = connect([[bytes(corrupted)], [_response(0x00, 0x42)]])
+
+    assert bus.read_byte_data(0x20, 0x01) == 0x42
+    assert len(sockets) == 2
+    assert sockets[0].closed
+
+
+def test_maintenance_uses_long_backoff(connect, monkeypatch: pytest.MonkeyPatch) -> None:
+    """A bridge in maintenance mode is retried after MAINTENANCE_BACKOFF, not the short back-off."""
+    sleeps: list[float] = []
+    monkeypatch.setattr(smbus_proxy, "time", SimpleNamespace(monotonic=time.monotonic, sleep=sleeps.append))
+    bus, _ = connect([[_response(0xFF, 0xEE, 0x01)], [_response(0x00, 0x42)]])
+
+    assert bus.read_byte_data(0x20, 0x01) == 0x42
+    assert sleeps == [smbus_proxy.MAINTENANCE_BACKOFF]
+
+
+def test_retries_exhausted_raise_oserror(connect) -> None:
+    """After three failed attempts the smbus2 compatible OSError is raised."""
+    bus, sockets = connect([])
+
+    with pytest.raises(OSError, match="Communication timeout"):
+        bus.read_byte_data(0x20, 0x01)
+    assert len(sockets) == 3
+
+
+def test_close_drops_the_connection(connect) -> None:
+    """close() closes the socket, the next command reconnects."""
+    bus, sockets = connect([[_response(0x00, 0x42)]])
+
+    bus.close()
+
+    assert sockets[0].closed
+    assert not bus.connected
+    assert bus.read_byte_data(0x20, 0x01) == 0x42
+    assert bus.connected